@@ -259,56 +259,8 @@ for i in range(50):
         "hint": hint, "image_url": ""
     })
 
-# ==========================================
-# Measurement Mission (50 questions)
-# ==========================================
-
-for i in range(50):
-    m_type = random.choice(["length", "weight", "time", "capacity"])
-
-    if m_type == "length":
-        cm = random.choice([100, 200, 500, 1000, 150, 250])
-        text1 = f"How many meters in {cm} centimeters?"
-        ans = str(cm / 100).replace(".0", "")
-        hint = "100 cm = 1 m"
-        opts = [ans, str(cm/10).replace(".0",""), str(cm*10), str(cm/2).replace(".0","")]
-
-    elif m_type == "weight":
-        kg = random.randint(1, 5)
-        text1 = f"How many grams in {kg} kilograms?"
-        ans = str(kg * 1000)
-        hint = "1 kg = 1000 g"
-        opts = [ans, str(kg*100), str(kg*10), str(kg*500)]
-
-    elif m_type == "time":
-        mins = random.choice([60, 120, 180, 30])
-        if mins < 60:
-            text1 = f"Is {mins} minutes more than an hour?"
-            ans = "No"
-            opts = ["Yes", "No", "Equal", "Maybe"]
-            hint = "60 minutes = 1 hour"
-        else:
-            text1 = f"How many hours is {mins} minutes?"
-            ans = str(mins // 60)
-            hint = "60 minutes = 1 hour"
-            opts = [ans, str(mins//30), str(mins//10), str(mins//15)]
-
-    elif m_type == "capacity":
-        liters = random.randint(2, 5)
-        text1 = f"How many 500ml bottles fill a {liters} liter jug?"
-        ans = str(liters * 2)
-        hint = "1 Liter = 2 x 500ml"
-        opts = [ans, str(liters), str(liters*4), str(liters+2)]
-
-    random.shuffle(opts)
-
-    rows.append({
-        "game_type": "measurement-mission",
-        "option1": opts[0], "option2": opts[1], "option3": opts[2], "option4": opts[3],
-        "text1": text1, "answer": ans, "know_more": "Measure carefully!",
-        "num1": "", "num2": "", "difficulty": "Medium", "operation": m_type,
-        "hint": hint, "image_url": ""
-    })
+# Measurement Mission is generated by scripts/generate_measurement.py, which replaces the
+# measurement-mission rows in place instead of appending, so it can be rerun safely.
 
 # Write to file
 output_rows = []
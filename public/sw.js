@@ -0,0 +1,125 @@
+// Service worker for offline play.
+// - Question banks listed in precache-manifest.json (built by scripts/build_precache_manifest.py)
+//   are cached up front and only re-downloaded when their content hash changes.
+// - The app shell (the start page and the hashed JS/CSS bundles) is listed in the same manifest
+//   by the deploy build and cached on install, so the app opens offline after the first visit.
+
+const DATA_CACHE = 'kani-data-v1';
+const SHELL_CACHE = 'kani-shell-v1';
+const SCOPE_URL = self.registration.scope;
+const MANIFEST_URL = new URL('precache-manifest.json', SCOPE_URL).href;
+// The last applied manifest is stored in the data cache under this key
+const MANIFEST_KEY = new URL('__precache-manifest__', self.registration.scope).href;
+
+const readManifest = async (cache) => {
+    const stored = await cache.match(MANIFEST_KEY);
+    return stored ? stored.json() : { version: null, files: [], shell: [] };
+};
+
+// Fetches the listed files whose hash changed; returns the URLs wanted and whether every fetch worked
+const fetchChanged = async (cache, files, previousFiles) => {
+    const previousHashes = new Map(previousFiles.map(file => [file.url, file.hash]));
+    const wanted = new Set();
+    const results = await Promise.all(files.map(async (file) => {
+        const url = new URL(file.url, SCOPE_URL).href;
+        wanted.add(url);
+        if (previousHashes.get(file.url) === file.hash && await cache.match(url)) return true;
+        try {
+            const response = await fetch(url, { cache: 'no-cache' });
+            if (!response.ok) return false;
+            await cache.put(url, response);
+            return true;
+        } catch {
+            return false;
+        }
+    }));
+    return { wanted, complete: results.every(Boolean) };
+};
+
+const syncData = async () => {
+    let manifest;
+    try {
+        const response = await fetch(MANIFEST_URL, { cache: 'no-cache' });
+        if (!response.ok) return;
+        manifest = await response.json();
+    } catch {
+        return; // Offline: keep serving what is cached
+    }
+
+    const cache = await caches.open(DATA_CACHE);
+    const shellCache = await caches.open(SHELL_CACHE);
+    const previous = await readManifest(cache);
+    if (previous.version === manifest.version) return;
+
+    // The manifest from `npm run dev` has no shell list
+    const data = await fetchChanged(cache, manifest.files, previous.files);
+    const shell = await fetchChanged(shellCache, manifest.shell || [], previous.shell || []);
+
+    // After a partial sync keep the old files and manifest, so the next sync retries what failed
+    if (!data.complete || !shell.complete) return;
+
+    for (const request of await cache.keys()) {
+        if (request.url !== MANIFEST_KEY && !data.wanted.has(request.url)) await cache.delete(request);
+    }
+    if (manifest.shell) {
+        // Bundles from older deploys are no longer referenced by the start page
+        for (const request of await shellCache.keys()) {
+            if (new URL(request.url).pathname.includes('/assets/') && !shell.wanted.has(request.url)) {
+                await shellCache.delete(request);
+            }
+        }
+    }
+    await cache.put(MANIFEST_KEY, new Response(JSON.stringify(manifest)));
+};
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(syncData().then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil(self.clients.claim());
+});
+
+// The page asks for a sync on every start, since sw.js itself rarely changes between deploys
+self.addEventListener('message', (event) => {
+    if (event.data === 'sync-data') event.waitUntil(syncData());
+});
+
+const cacheFirst = async (request, cacheName) => {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(request, { ignoreSearch: true });
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok && cacheName === SHELL_CACHE) cache.put(request, response.clone());
+    return response;
+};
+
+const networkFirst = async (request) => {
+    const cache = await caches.open(SHELL_CACHE);
+    try {
+        const response = await fetch(request);
+        if (response.ok) cache.put(request, response.clone());
+        return response;
+    } catch (e) {
+        // Any page in scope is the same single page app, so fall back to the precached start page
+        const cached = await cache.match(request) || await cache.match(SCOPE_URL);
+        if (cached) return cached;
+        throw e;
+    }
+};
+
+self.addEventListener('fetch', (event) => {
+    const { request } = event;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== self.location.origin) return;
+    if (url.href === MANIFEST_URL) return;
+
+    if (request.mode === 'navigate') {
+        event.respondWith(networkFirst(request));
+    } else if (/\.(csv|json)$/.test(url.pathname)) {
+        event.respondWith(cacheFirst(request, DATA_CACHE));
+    } else if (url.pathname.includes('/assets/')) {
+        // Vite bundles have content hashes in their names, so they never go stale
+        event.respondWith(cacheFirst(request, SHELL_CACHE));
+    }
+});
@@ -0,0 +1,220 @@
+import argparse
+import hashlib
+import os
+import sys
+
+from data_pipeline import (
+    GAME_TYPE_RE, PUBLIC_BANKS, assign_row_ids, dedup_rows, group_by_game_type, read_csv, render_csv,
+    repo_path, row_id, shard_path, write_if_changed,
+)
+
+# Applies small keyed patch files over the public banks as ordered layers.
+#
+#   patches/<BANK>/0001-some-fix.csv  ->  on top of public/<BANK>.csv
+#
+# Each layer is a CSV with an `op` column (add, replace, delete), an `id` column and any bank
+# columns. Ids are the stable row ids from data_pipeline.row_id (see --ids). `replace` only
+# overwrites the columns present in the layer.
+#
+# The bank in public/ stays unpatched: layers are re-applied on top of it every time the
+# per-game files in public/games/ are built, so rewriting the bank never loses a fix.
+#
+# The result after each layer is cached in patches/.cache/<BANK>/, keyed by the bank hash and
+# the hashes of the layers up to that one. Adding a layer only applies the new layer on top of
+# the cached result of the ones before it.
+#
+# The app can also fetch a whole bank (Settings > Use Google Sheets with the default URLs), so
+# the deploy writes the patched banks over their copies in dist/ with --emit DIR.
+
+PATCHES_DIR = 'patches'
+CACHE_DIR = 'patches/.cache'
+OPS = {'add', 'replace', 'delete'}
+
+
+class PatchError(Exception):
+    pass
+
+
+def file_digest(rel_path):
+    with open(repo_path(rel_path), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def layer_dirs():
+    patches_dir = repo_path(PATCHES_DIR)
+    if not os.path.isdir(patches_dir):
+        return []
+    return sorted(name for name in os.listdir(patches_dir)
+                  if os.path.isdir(os.path.join(patches_dir, name)) and not name.startswith('.'))
+
+
+def layer_paths(bank_dir):
+    directory = repo_path(f"{PATCHES_DIR}/{bank_dir}")
+    return [f"{PATCHES_DIR}/{bank_dir}/{name}" for name in sorted(os.listdir(directory)) if name.endswith('.csv')]
+
+
+def bank_layers(bank):
+    bank_dir = os.path.splitext(os.path.basename(bank))[0]
+    if not os.path.isdir(repo_path(f"{PATCHES_DIR}/{bank_dir}")):
+        return []
+    return layer_paths(bank_dir)
+
+
+def check_layer_dirs():
+    for bank_dir in layer_dirs():
+        if f"public/{bank_dir}.csv" not in PUBLIC_BANKS:
+            raise PatchError(f"{PATCHES_DIR}/{bank_dir} does not match a bank in public/")
+
+
+def apply_layer(fieldnames, rows, layer_path):
+    layer_fields, layer_rows = read_csv(layer_path)
+    if 'op' not in layer_fields:
+        raise PatchError(f"{layer_path}: missing 'op' column")
+    content_fields = [field for field in layer_fields if field not in ('op', 'id')]
+    fieldnames = fieldnames + [field for field in content_fields if field not in fieldnames]
+
+    index = {rid: position for position, rid in enumerate(assign_row_ids(rows))}
+    rows = list(rows)
+    deleted = set()
+
+    for line, patch in enumerate(layer_rows, start=2):
+        op = (patch.get('op') or '').strip().lower()
+        if op not in OPS:
+            raise PatchError(f"{layer_path}:{line}: unknown op {op!r}")
+        values = {field: patch.get(field) or '' for field in content_fields}
+
+        if op == 'add':
+            rid = row_id(values)
+            if rid not in index:
+                index[rid] = len(rows)
+                rows.append(values)
+                continue
+            # Re-adding an existing question acts as a replace, which keeps layers idempotent
+            target = rid
+        else:
+            target = (patch.get('id') or '').strip()
+            if target not in index:
+                raise PatchError(f"{layer_path}:{line}: no row with id {target!r}")
+
+        position = index[target]
+        if op == 'delete':
+            deleted.add(position)
+        else:
+            rows[position] = {**rows[position], **values}
+
+    rows = [row for position, row in enumerate(rows) if position not in deleted]
+    return fieldnames, rows
+
+
+def patched_bank(bank):
+    """The bank with its layers applied, as (fieldnames, rows)."""
+    layers = bank_layers(bank)
+    if not layers:
+        return read_csv(bank)
+
+    # keys[i] identifies the bank with the first i + 1 layers applied
+    keys = []
+    key = file_digest(bank)
+    for layer in layers:
+        key = hashlib.sha1(f"{key}\n{os.path.basename(layer)}\n{file_digest(layer)}".encode('utf-8')).hexdigest()
+        keys.append(key)
+
+    cache_dir = f"{CACHE_DIR}/{os.path.splitext(os.path.basename(bank))[0]}"
+    os.makedirs(repo_path(cache_dir), exist_ok=True)
+    # Start from the longest cached prefix and apply only the layers after it
+    done = next((count for count in range(len(layers), 0, -1)
+                 if os.path.exists(repo_path(f"{cache_dir}/{keys[count - 1]}.csv"))), 0)
+    fieldnames, rows = read_csv(f"{cache_dir}/{keys[done - 1]}.csv" if done else bank)
+    for count in range(done, len(layers)):
+        fieldnames, rows = apply_layer(fieldnames, rows, layers[count])
+        write_if_changed(f"{cache_dir}/{keys[count]}.csv", render_csv(fieldnames, rows))
+
+    # Results for edited or removed layers can never be hit again
+    for name in os.listdir(repo_path(cache_dir)):
+        if name.endswith('.csv') and name[:-4] not in keys:
+            os.remove(repo_path(f"{cache_dir}/{name}"))
+    return fieldnames, rows
+
+
+def emit_banks(out_dir):
+    """Write each bank with layers, patched, to out_dir/<BANK>.csv; returns the paths written."""
+    written = []
+    for bank in PUBLIC_BANKS:
+        if not bank_layers(bank):
+            continue
+        target = os.path.join(out_dir, os.path.basename(bank))
+        if not os.path.isdir(repo_path(out_dir)):
+            raise PatchError(f"{out_dir} does not exist; run npm run build first")
+        write_if_changed(target, render_csv(*patched_bank(bank)))
+        written.append(target)
+    return written
+
+
+def shard_texts(bank):
+    """shard path -> expected text for every valid game_type in the patched bank."""
+    fieldnames, rows = patched_bank(bank)
+    shards = {}
+    for game_type, group in group_by_game_type(rows).items():
+        if GAME_TYPE_RE.match(game_type):
+            shards[shard_path(game_type)] = render_csv(fieldnames, dedup_rows(group, fieldnames)[0])
+    return shards
+
+
+def build_shards(check=False):
+    """Write (or with check, only compare) every per-game file; returns the paths that differ."""
+    check_layer_dirs()
+    differing = []
+    for bank in PUBLIC_BANKS:
+        for path, text in shard_texts(bank).items():
+            if check:
+                try:
+                    with open(repo_path(path), 'r', encoding='utf-8', newline='') as f:
+                        current = f.read()
+                except FileNotFoundError:
+                    current = None
+                if current != text:
+                    differing.append(path)
+            elif write_if_changed(path, text):
+                differing.append(path)
+    return differing
+
+
+def print_ids(rel_path):
+    fieldnames, rows = read_csv(rel_path)
+    for rid, row in zip(assign_row_ids(rows), rows):
+        print(f"{rid}\t{row.get('game_type', '')}\t{row.get('difficulty', '')}\t{row.get('text1', '')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild public/games/ from the public banks plus their patch layers.")
+    parser.add_argument('--check', action='store_true', help="Exit with status 1 if any per-game file is out of date")
+    parser.add_argument('--ids', metavar='CSV', help="Print the stable row ids of a bank and exit")
+    parser.add_argument('--emit', metavar='DIR',
+                        help="Also write the patched banks to DIR (e.g. dist after npm run build)")
+    args = parser.parse_args()
+
+    if args.ids:
+        print_ids(args.ids)
+        return
+
+    try:
+        differing = build_shards(check=args.check)
+        emitted = emit_banks(args.emit) if args.emit and not args.check else []
+    except PatchError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.check:
+        if differing:
+            print(f"{len(differing)} per-game file(s) out of date: {', '.join(differing)}")
+            print("Run python scripts/apply_patches.py and commit the result.")
+            sys.exit(1)
+        print("Per-game files match the banks and patch layers.")
+        return
+    print(f"Rebuilt {len(differing)} per-game file(s)" + (f": {', '.join(differing)}" if differing else ""))
+    for path in emitted:
+        print(f"Wrote patched bank {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+
+from data_pipeline import PUBLIC_DIR, repo_path, write_if_changed
+
+# Writes precache-manifest.json for public/sw.js. The service worker only re-downloads
+# files whose hash changed, so banks that did not change survive deploys in the device cache.
+# The manifest has no timestamps: rebuilding unchanged data produces an identical file.
+#
+# Run with --dist after `vite build` to also list the app shell (the start page and the
+# hashed bundles in assets/), which the service worker caches on install.
+
+MANIFEST_NAME = 'precache-manifest.json'
+MANIFEST_FILE = f"{PUBLIC_DIR}/{MANIFEST_NAME}"
+PATTERNS = ['*.csv', '*.json', 'games/*.csv', 'puzzles/*.csv']
+SHELL_PATTERNS = ['index.html', 'assets/*']
+
+
+def content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def collect_files(root, patterns):
+    paths = set()
+    for pattern in patterns:
+        paths.update(path for path in glob.glob(os.path.join(repo_path(root), pattern)) if os.path.isfile(path))
+    paths.discard(repo_path(os.path.join(root, MANIFEST_NAME)))
+
+    files = []
+    for path in sorted(paths):
+        # Relative to the app base, matching how the app fetches them
+        url = os.path.relpath(path, repo_path(root)).replace(os.sep, '/')
+        files.append({
+            # The start page is requested as the app base, not as index.html
+            'url': './' if url == 'index.html' else url,
+            'size': os.path.getsize(path),
+            'hash': content_hash(path),
+        })
+    return files
+
+
+def build_manifest(root=PUBLIC_DIR, shell=False):
+    files = collect_files(root, PATTERNS)
+    shell_files = collect_files(root, SHELL_PATTERNS) if shell else []
+    version = hashlib.sha256(''.join(f"{f['url']}:{f['hash']}\n" for f in files + shell_files).encode('utf-8')).hexdigest()[:12]
+    return {
+        'version': version,
+        'total_bytes': sum(f['size'] for f in files + shell_files),
+        'files': files,
+        'shell': shell_files,
+    }
+
+
+def write_manifest(root=PUBLIC_DIR, shell=False):
+    manifest = build_manifest(root, shell)
+    changed = write_if_changed(os.path.join(root, MANIFEST_NAME), json.dumps(manifest, indent=2) + '\n')
+    return manifest, changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the service worker precache manifest.")
+    parser.add_argument('--dist', metavar='DIR',
+                        help="Built app directory (e.g. dist): list its files and app shell and write the manifest there")
+    parser.add_argument('--check', action='store_true', help="Exit with status 1 if the manifest is out of date")
+    args = parser.parse_args()
+
+    root = args.dist or PUBLIC_DIR
+    target = os.path.join(root, MANIFEST_NAME)
+    if args.dist and not os.path.isfile(repo_path(os.path.join(root, 'index.html'))):
+        sys.exit(f"{root}/index.html not found; run npm run build first")
+
+    if args.check:
+        manifest = build_manifest(root, shell=bool(args.dist))
+        try:
+            with open(repo_path(target), 'r', encoding='utf-8') as f:
+                current = json.load(f)
+        except FileNotFoundError:
+            current = {}
+        if current.get('version') != manifest['version']:
+            print(f"{target} is out of date (expected version {manifest['version']})")
+            sys.exit(1)
+        print(f"{target} is up to date")
+        return
+
+    manifest, changed = write_manifest(root, shell=bool(args.dist))
+    state = "Wrote" if changed else "Unchanged"
+    print(f"{state} {target}: version {manifest['version']}, "
+          f"{len(manifest['files'])} data files, {len(manifest['shell'])} shell files, "
+          f"{manifest['total_bytes'] / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
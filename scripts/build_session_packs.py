@@ -0,0 +1,167 @@
+import argparse
+import csv
+import glob
+import json
+import math
+import os
+import random
+import sys
+import time
+
+from data_pipeline import GAMES_DIR, render_csv, repo_path, row_id, write_if_changed
+
+# Builds per-child session packs from question history exported by src/utils/questionHistory.ts.
+# Each child's done ids go into a Bloom filter, then every bank is streamed once: each row is
+# hashed once, checked against every child's filter, and reservoir-sampled into that child's pack.
+# Memory is the filters (about 1.2 bytes per id at 1% false positives) plus the packs themselves.
+#
+#   python scripts/build_session_packs.py --history history/ --size 20
+#
+# Questions come from the per-game files in public/games/, which are what the app plays by
+# default. Packs are written to packs/<child>/<game_type>.csv in the same layout.
+
+PACKS_DIR = 'packs'
+HISTORY_DIR = 'history'
+
+
+class BloomFilter:
+    """Bit array membership test over question ids; false positives only drop a few extra questions."""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(1, capacity)
+        # Tiny arrays make the double-hashed positions repeat, so keep at least 64 bits
+        self.size = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, question_id):
+        # Ids are already 64-bit hashes, so double hashing on their two halves is enough
+        value = int(question_id[:16], 16)
+        low, high = value & 0xffffffff, (value >> 32) | 1
+        return ((low + i * high) % self.size for i in range(self.hashes))
+
+    def add(self, question_id):
+        for position in self._positions(question_id):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, question_id):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(question_id))
+
+
+def load_histories(paths, exclude_seen, error_rate):
+    files = []
+    for path in paths:
+        files.extend(sorted(glob.glob(os.path.join(path, '*.json'))) if os.path.isdir(path) else [path])
+
+    filters = {}
+    for path in files:
+        with open(path, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+        if history.get('version') != 1:
+            sys.exit(f"{path}: unsupported history version {history.get('version')!r}")
+        done = set(history.get('answered', []))
+        if exclude_seen:
+            done.update(history.get('seen', []))
+        bloom = BloomFilter(len(done), error_rate)
+        for question_id in done:
+            bloom.add(question_id)
+        filters[history['child']] = bloom
+    return filters
+
+
+def game_files():
+    return sorted(os.path.relpath(path, repo_path('')).replace(os.sep, '/')
+                  for path in glob.glob(repo_path(f"{GAMES_DIR}/*.csv")))
+
+
+def browser_id(row):
+    # The app trims every field when parsing, so hash the trimmed values it sees
+    return row_id({field: (value or '').strip() for field, value in row.items() if field})
+
+
+def build_packs(banks, filters, size, seed):
+    started = time.perf_counter()
+    rngs = {child: random.Random(f"{seed}:{child}") for child in filters}
+    # (child, game_type, difficulty) -> [rows considered, [(id, row), ...]]
+    reservoirs = {}
+    fieldnames_by_game = {}
+    scanned = 0
+    excluded = dict.fromkeys(filters, 0)
+
+    for bank in banks:
+        with open(repo_path(bank), 'r', encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f, restval='')
+            for row in reader:
+                game_type = row.get('game_type', '').strip()
+                if not game_type:
+                    continue
+                scanned += 1
+                fieldnames_by_game.setdefault(game_type, reader.fieldnames)
+                question_id = browser_id(row)
+                difficulty = row.get('difficulty', '').strip()
+                for child, bloom in filters.items():
+                    if question_id in bloom:
+                        excluded[child] += 1
+                        continue
+                    entry = reservoirs.setdefault((child, game_type, difficulty), [0, []])
+                    chosen = entry[1]
+                    if any(chosen_id == question_id for chosen_id, _ in chosen):
+                        continue
+                    entry[0] += 1
+                    if len(chosen) < size:
+                        chosen.append((question_id, row))
+                    else:
+                        slot = rngs[child].randrange(entry[0])
+                        if slot < size:
+                            chosen[slot] = (question_id, row)
+
+    packs = {}
+    for (child, game_type, _), (_, chosen) in sorted(reservoirs.items()):
+        packs.setdefault((child, game_type), []).extend(row for _, row in chosen)
+    stats = {'scanned': scanned, 'excluded': excluded, 'seconds': time.perf_counter() - started}
+    return packs, fieldnames_by_game, stats
+
+
+def safe_name(child):
+    return ''.join(c if c.isalnum() or c in '-_' else '_' for c in child) or 'default'
+
+
+def write_packs(packs, fieldnames_by_game, out_dir):
+    written = 0
+    for (child, game_type), rows in packs.items():
+        rel = os.path.join(out_dir, safe_name(child), f"{game_type}.csv")
+        os.makedirs(os.path.dirname(repo_path(rel)), exist_ok=True)
+        written += write_if_changed(rel, render_csv(fieldnames_by_game[game_type], rows))
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build per-child session packs that skip questions already done.")
+    parser.add_argument('--history', nargs='+', default=[HISTORY_DIR],
+                        help="History export files, or directories of them (default: history/)")
+    parser.add_argument('--banks', nargs='+', help="Question files to draw from (default: public/games/*.csv)")
+    parser.add_argument('--size', type=int, default=10, help="Questions per game and difficulty (default: 10)")
+    parser.add_argument('--exclude-seen', action='store_true',
+                        help="Also skip questions that were shown but answered wrongly")
+    parser.add_argument('--error-rate', type=float, default=0.01, help="Bloom filter false positive rate")
+    parser.add_argument('--seed', default='kani', help="Sampling seed, so rebuilding gives the same packs")
+    parser.add_argument('--output', default=PACKS_DIR)
+    args = parser.parse_args()
+
+    filters = load_histories(args.history, args.exclude_seen, args.error_rate)
+    if not filters:
+        sys.exit(f"No history exports found in {', '.join(args.history)}")
+
+    packs, fieldnames_by_game, stats = build_packs(args.banks or game_files(), filters, args.size, args.seed)
+    written = write_packs(packs, fieldnames_by_game, args.output)
+
+    print(f"Scanned {stats['scanned']} questions for {len(filters)} child(ren) in {stats['seconds'] * 1000:.0f} ms")
+    for child, bloom in filters.items():
+        pack_rows = sum(len(rows) for (name, _), rows in packs.items() if name == child)
+        print(f"  {child}: {pack_rows} questions packed, {stats['excluded'][child]} skipped, "
+              f"filter {len(bloom.bits)} bytes")
+    print(f"{written} pack file(s) written to {args.output}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import csv
+import hashlib
+import io
+import os
+import re
+
+# Shared helpers for the question bank build stages (validate, dedup, shard).
+# Paths are relative to the repository root so scripts can be run from anywhere.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PUBLIC_DIR = 'public'
+GAMES_DIR = 'public/games'
+
+# Authoring copy in the repo root -> copy served by the app
+ROOT_BANKS = {
+    'MATH_GOOGLE_SHEET_DATA.csv': 'public/MATH_GOOGLE_SHEET_DATA.csv',
+    'ENGLISH_GOOGLE_SHEET_DATA.csv': 'public/ENGLISH_GOOGLE_SHEET_DATA.csv',
+    'SKILL_GAMES_DATA.csv': 'public/SKILL_GAMES_DATA.csv',
+}
+PUBLIC_BANKS = list(ROOT_BANKS.values())
+
+# Authored sources with no public copy; these are only validated
+SOURCE_ONLY = ['COMPREHENSION_STORIES.csv']
+
+DIFFICULTIES = {'Easy', 'Medium', 'Hard'}
+
+# Fields that identify a question; answers, options and hints can be fixed without changing its id
+IDENTITY_FIELDS = ['game_type', 'difficulty', 'text1', 'text2', 'num1', 'num2', 'operation', 'story_id', 'question_num']
+GAME_TYPE_RE = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+
+
+def repo_path(rel_path):
+    return os.path.join(ROOT, rel_path)
+
+
+def read_csv(rel_path):
+    with open(repo_path(rel_path), 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f, restval='')
+        rows = list(reader)
+        return list(reader.fieldnames or []), rows
+
+
+def read_csv_records(rel_path):
+    """Like read_csv, but each row comes with its original text so untouched rows can be written back as is."""
+    raw = []
+
+    def lines(f):
+        for line in f:
+            raw.append(line)
+            yield line
+
+    with open(repo_path(rel_path), 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(lines(f), restval='')
+        fieldnames = list(reader.fieldnames or [])
+        header = ''.join(raw)
+        raw.clear()
+        records = []
+        for row in reader:
+            records.append((row, ''.join(raw)))
+            raw.clear()
+    return fieldnames, header, records
+
+
+def render_row(fieldnames, row, lineterminator='\n'):
+    out = io.StringIO()
+    csv.DictWriter(out, fieldnames=fieldnames, restval='', extrasaction='ignore', lineterminator=lineterminator).writerow(row)
+    return out.getvalue()
+
+
+def render_csv(fieldnames, rows):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=fieldnames, restval='', extrasaction='ignore', lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+def write_if_changed(rel_path, text):
+    # Skipping identical writes keeps mtimes stable, which the watcher and the browser cache rely on
+    path = repo_path(rel_path)
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+def group_by_game_type(rows):
+    groups = {}
+    for row in rows:
+        groups.setdefault(row.get('game_type') or '', []).append(row)
+    return groups
+
+
+def row_values(row, fieldnames):
+    return tuple(row.get(field) or '' for field in fieldnames)
+
+
+def fingerprint(rows, fieldnames):
+    digest = hashlib.sha1()
+    for row in rows:
+        digest.update('\x1f'.join(row_values(row, fieldnames)).encode('utf-8'))
+        digest.update(b'\x1e')
+    return digest.hexdigest()
+
+
+def fingerprint_game_types(fieldnames, rows):
+    return {game_type: fingerprint(group, fieldnames) for game_type, group in group_by_game_type(rows).items()}
+
+
+def fnv1a64(text):
+    # Tiny and dependency free, so the app can compute the same ids in the browser
+    value = 0xcbf29ce484222325
+    for byte in text.encode('utf-8'):
+        value = ((value ^ byte) * 0x100000001b3) & 0xffffffffffffffff
+    return f"{value:016x}"
+
+
+def row_id(row):
+    return fnv1a64('\x1f'.join(row.get(field) or '' for field in IDENTITY_FIELDS))
+
+
+def assign_row_ids(rows):
+    # Rows with the same identity get an occurrence suffix (abc, abc-2, ...) so every id is unique
+    ids = []
+    seen = {}
+    for row in rows:
+        base = row_id(row)
+        seen[base] = seen.get(base, 0) + 1
+        ids.append(base if seen[base] == 1 else f"{base}-{seen[base]}")
+    return ids
+
+
+def dedup_rows(rows, fieldnames):
+    seen = set()
+    unique = []
+    for row in rows:
+        key = row_values(row, fieldnames)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(row)
+    return unique, len(rows) - len(unique)
+
+
+def validate_rows(rows, label):
+    problems = []
+    for index, row in enumerate(rows):
+        where = f"{label} row {index + 1}"
+        game_type = row.get('game_type') or ''
+        if None in row:
+            problems.append(f"{where}: {len(row[None])} extra field(s), check for unquoted commas")
+        if any('\x00' in (value or '') for value in row.values() if isinstance(value, str)):
+            problems.append(f"{where}: contains NUL bytes, file was probably appended as UTF-16")
+            continue
+        if not GAME_TYPE_RE.match(game_type):
+            problems.append(f"{where}: invalid game_type {game_type!r}")
+            continue
+        difficulty = row.get('difficulty') or ''
+        if difficulty and difficulty not in DIFFICULTIES:
+            problems.append(f"{where}: unknown difficulty {difficulty!r}")
+    return problems
+
+
+def shard_path(game_type):
+    return f"{GAMES_DIR}/{game_type}.csv"
+
+
+def write_shard(game_type, fieldnames, rows):
+    unique, dropped = dedup_rows(rows, fieldnames)
+    changed = write_if_changed(shard_path(game_type), render_csv(fieldnames, unique))
+    return changed, dropped
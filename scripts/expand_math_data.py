@@ -1,22 +1,31 @@
+import argparse
 import csv
 import random
 import sys
 
+from profiling import Profiler, add_profile_arguments, enable_from_args
+
 OUTPUT_FILE = 'public/MATH_GOOGLE_SHEET_DATA.csv'
 
+# Disabled unless --profile/--cprofile is passed
+PROFILER = Profiler()
+
 def get_distractors(correct_val, generator_func, count=3, max_attempts=50):
-    options = {correct_val}
-    attempts = 0
-    while len(options) < count + 1 and attempts < max_attempts:
-        val = generator_func()
-        if val != correct_val:
-            options.add(val)
-        attempts += 1
-
-    # If we couldn't find enough unique distractors, fill with anything reasonable or duplicates if really stuck
-    result = list(options)
-    while len(result) < count + 1:
-         result.append(generator_func()) # Just append even if duplicate to break loop
+    with PROFILER.stage('distractors'):
+        options = {correct_val}
+        attempts = 0
+        while len(options) < count + 1 and attempts < max_attempts:
+            val = generator_func()
+            if val != correct_val:
+                options.add(val)
+            attempts += 1
+        PROFILER.count('distractor_retries', attempts - (len(options) - 1))
+
+        # If we couldn't find enough unique distractors, fill with anything reasonable or duplicates if really stuck
+        result = list(options)
+        while len(result) < count + 1:
+             PROFILER.count('distractor_fallbacks')
+             result.append(generator_func()) # Just append even if duplicate to break loop
 
     random.shuffle(result)
     return result
@@ -38,21 +47,22 @@ def generate_fraction_questions():
 
         opt_list = get_distractors(correct, gen_fraction)
 
-        questions.append({
-            'game_type': 'fraction-frenzy',
-            'operation': 'identify',
-            'num1': str(num),
-            'num2': str(den),
-            'answer': correct,
-            'option1': opt_list[0],
-            'option2': opt_list[1],
-            'option3': opt_list[2],
-            'option4': opt_list[3],
-            'difficulty': 'Easy',
-            'hint': f'Count the shaded parts (top) and total parts (bottom).',
-            'know_more': f'The top number (numerator) counts shaded parts. The bottom number (denominator) counts total parts.',
-            'image_url': f'dynamic:fraction:{num}:{den}'
-        })
+        with PROFILER.stage('format'):
+            questions.append({
+                'game_type': 'fraction-frenzy',
+                'operation': 'identify',
+                'num1': str(num),
+                'num2': str(den),
+                'answer': correct,
+                'option1': opt_list[0],
+                'option2': opt_list[1],
+                'option3': opt_list[2],
+                'option4': opt_list[3],
+                'difficulty': 'Easy',
+                'hint': f'Count the shaded parts (top) and total parts (bottom).',
+                'know_more': f'The top number (numerator) counts shaded parts. The bottom number (denominator) counts total parts.',
+                'image_url': f'dynamic:fraction:{num}:{den}'
+            })
 
     # 2. Compare
     for _ in range(15):
@@ -68,21 +78,22 @@ def generate_fraction_questions():
         elif val1 > val2: answer = ">"; hint = "Left is bigger"
         else: answer = "<"; hint = "Right is bigger"
 
-        questions.append({
-            'game_type': 'fraction-frenzy',
-            'operation': 'compare',
-            'num1': f"{num1}/{den1}",
-            'num2': f"{num2}/{den2}",
-            'answer': answer,
-            'option1': '>',
-            'option2': '<',
-            'option3': '=',
-            'option4': '?',
-            'difficulty': 'Medium',
-            'hint': hint,
-            'know_more': 'Compare shaded areas.',
-            'image_url': f'dynamic:compare:{num1}:{den1}:{num2}:{den2}'
-        })
+        with PROFILER.stage('format'):
+            questions.append({
+                'game_type': 'fraction-frenzy',
+                'operation': 'compare',
+                'num1': f"{num1}/{den1}",
+                'num2': f"{num2}/{den2}",
+                'answer': answer,
+                'option1': '>',
+                'option2': '<',
+                'option3': '=',
+                'option4': '?',
+                'difficulty': 'Medium',
+                'hint': hint,
+                'know_more': 'Compare shaded areas.',
+                'image_url': f'dynamic:compare:{num1}:{den1}:{num2}:{den2}'
+            })
 
     # 3. Fill Blank
     equivalents = [
@@ -94,21 +105,22 @@ def generate_fraction_questions():
     ]
 
     for n1, d1, n2, d2 in equivalents:
-        questions.append({
-            'game_type': 'fraction-frenzy',
-            'operation': 'fill-blank',
-            'num1': f"{n1}/{d1}",
-            'num2': f"?/{d2}",
-            'answer': str(n2),
-            'option1': str(n2),
-            'option2': str(n2 + 1),
-            'option3': str(n2 - 1 if n2 > 1 else n2 + 2),
-            'option4': str(d2),
-            'difficulty': 'Hard',
-            'hint': f'Equivalent fractions.',
-            'know_more': f'{n1}/{d1} is the same as {n2}/{d2}.',
-            'image_url': f'dynamic:fraction:{n1}:{d1}'
-        })
+        with PROFILER.stage('format'):
+            questions.append({
+                'game_type': 'fraction-frenzy',
+                'operation': 'fill-blank',
+                'num1': f"{n1}/{d1}",
+                'num2': f"?/{d2}",
+                'answer': str(n2),
+                'option1': str(n2),
+                'option2': str(n2 + 1),
+                'option3': str(n2 - 1 if n2 > 1 else n2 + 2),
+                'option4': str(d2),
+                'difficulty': 'Hard',
+                'hint': f'Equivalent fractions.',
+                'know_more': f'{n1}/{d1} is the same as {n2}/{d2}.',
+                'image_url': f'dynamic:fraction:{n1}:{d1}'
+            })
 
     # 4. Add
     for _ in range(10):
@@ -122,21 +134,22 @@ def generate_fraction_questions():
 
         opt_list = get_distractors(ans, gen_add_distractor)
 
-        questions.append({
-            'game_type': 'fraction-frenzy',
-            'operation': 'add',
-            'num1': f"{n1}/{den}",
-            'num2': f"{n2}/{den}",
-            'answer': ans,
-            'option1': opt_list[0],
-            'option2': opt_list[1],
-            'option3': opt_list[2],
-            'option4': opt_list[3],
-            'difficulty': 'Medium',
-            'hint': 'Add top numbers.',
-            'know_more': 'Sum of parts.',
-            'image_url': f'dynamic:add:{n1}:{den}:{n2}:{den}'
-        })
+        with PROFILER.stage('format'):
+            questions.append({
+                'game_type': 'fraction-frenzy',
+                'operation': 'add',
+                'num1': f"{n1}/{den}",
+                'num2': f"{n2}/{den}",
+                'answer': ans,
+                'option1': opt_list[0],
+                'option2': opt_list[1],
+                'option3': opt_list[2],
+                'option4': opt_list[3],
+                'difficulty': 'Medium',
+                'hint': 'Add top numbers.',
+                'know_more': 'Sum of parts.',
+                'image_url': f'dynamic:add:{n1}:{den}:{n2}:{den}'
+            })
 
     return questions
 
@@ -151,20 +164,21 @@ def generate_geometry_questions():
         def gen_shape(): return random.choice(shapes_2d).capitalize()
         opt_list = get_distractors(correct, gen_shape)
 
-        questions.append({
-            'game_type': 'geometry-galaxy',
-            'operation': 'identify',
-            'text1': shape,
-            'answer': correct,
-            'option1': opt_list[0],
-            'option2': opt_list[1],
-            'option3': opt_list[2],
-            'option4': opt_list[3],
-            'difficulty': 'Easy',
-            'hint': 'Count sides/corners.',
-            'know_more': f'{shape} shape.',
-            'image_url': f'dynamic:shape:{shape}'
-        })
+        with PROFILER.stage('format'):
+            questions.append({
+                'game_type': 'geometry-galaxy',
+                'operation': 'identify',
+                'text1': shape,
+                'answer': correct,
+                'option1': opt_list[0],
+                'option2': opt_list[1],
+                'option3': opt_list[2],
+                'option4': opt_list[3],
+                'difficulty': 'Easy',
+                'hint': 'Count sides/corners.',
+                'know_more': f'{shape} shape.',
+                'image_url': f'dynamic:shape:{shape}'
+            })
 
     shapes_3d = ['cube', 'sphere']
     fake_3d = ['Cube', 'Sphere', 'Cone', 'Cylinder', 'Pyramid']
@@ -173,31 +187,10 @@ def generate_geometry_questions():
         def gen_3d(): return random.choice(fake_3d)
         opt_list = get_distractors(correct, gen_3d)
 
-        questions.append({
-            'game_type': 'geometry-galaxy',
-            'operation': 'identify',
-            'text1': shape,
-            'answer': correct,
-            'option1': opt_list[0],
-            'option2': opt_list[1],
-            'option3': opt_list[2],
-            'option4': opt_list[3],
-            'difficulty': 'Medium',
-            'hint': '3D Object.',
-            'know_more': f'{shape} is 3D.',
-            'image_url': f'dynamic:shape:{shape}'
-        })
-
-    sides_map = {'triangle': 3, 'square': 4, 'rectangle': 4, 'pentagon': 5, 'hexagon': 6, 'octagon': 8}
-    for shape, sides in sides_map.items():
-        for _ in range(2):
-            correct = str(sides)
-            def gen_sides(): return str(random.randint(3, 10))
-            opt_list = get_distractors(correct, gen_sides)
-
+        with PROFILER.stage('format'):
             questions.append({
                 'game_type': 'geometry-galaxy',
-                'operation': 'sides',
+                'operation': 'identify',
                 'text1': shape,
                 'answer': correct,
                 'option1': opt_list[0],
@@ -205,11 +198,34 @@ def generate_geometry_questions():
                 'option3': opt_list[2],
                 'option4': opt_list[3],
                 'difficulty': 'Medium',
-                'hint': 'Count lines.',
-                'know_more': f'{sides} sides.',
+                'hint': '3D Object.',
+                'know_more': f'{shape} is 3D.',
                 'image_url': f'dynamic:shape:{shape}'
             })
 
+    sides_map = {'triangle': 3, 'square': 4, 'rectangle': 4, 'pentagon': 5, 'hexagon': 6, 'octagon': 8}
+    for shape, sides in sides_map.items():
+        for _ in range(2):
+            correct = str(sides)
+            def gen_sides(): return str(random.randint(3, 10))
+            opt_list = get_distractors(correct, gen_sides)
+
+            with PROFILER.stage('format'):
+                questions.append({
+                    'game_type': 'geometry-galaxy',
+                    'operation': 'sides',
+                    'text1': shape,
+                    'answer': correct,
+                    'option1': opt_list[0],
+                    'option2': opt_list[1],
+                    'option3': opt_list[2],
+                    'option4': opt_list[3],
+                    'difficulty': 'Medium',
+                    'hint': 'Count lines.',
+                    'know_more': f'{sides} sides.',
+                    'image_url': f'dynamic:shape:{shape}'
+                })
+
     return questions
 
 def generate_money_questions():
@@ -239,64 +255,76 @@ def generate_money_questions():
 
         opt_list = get_distractors(correct, gen_money_distractor)
 
-        questions.append({
-            'game_type': 'money-master',
-            'operation': 'count',
-            'num1': 'Count Coins',
-            'answer': correct,
-            'option1': opt_list[0],
-            'option2': opt_list[1],
-            'option3': opt_list[2],
-            'option4': opt_list[3],
-            'difficulty': 'Easy' if total < 50 else 'Medium',
-            'hint': 'Sum the values.',
-            'know_more': f'Total is {total}¢.',
-            'image_url': img_url
-        })
+        with PROFILER.stage('format'):
+            questions.append({
+                'game_type': 'money-master',
+                'operation': 'count',
+                'num1': 'Count Coins',
+                'answer': correct,
+                'option1': opt_list[0],
+                'option2': opt_list[1],
+                'option3': opt_list[2],
+                'option4': opt_list[3],
+                'difficulty': 'Easy' if total < 50 else 'Medium',
+                'hint': 'Sum the values.',
+                'know_more': f'Total is {total}¢.',
+                'image_url': img_url
+            })
 
     for _ in range(20):
         price = random.choice([25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90, 95])
         change = 100 - price
-        questions.append({
-            'game_type': 'money-master',
-            'operation': 'change',
-            'num1': f'Price: {price}¢',
-            'num2': 'change',
-            'text1': 'Paid: $1.00',
-            'answer': f"{change}¢",
-            'option1': f"{change}¢",
-            'option2': f"{change + 5}¢",
-            'option3': f"{change - 5}¢",
-            'option4': f"{change + 10}¢",
-            'difficulty': 'Hard',
-            'hint': f'100 - {price}',
-            'know_more': f'Change is {change}¢.',
-            'image_url': ''
-        })
+        with PROFILER.stage('format'):
+            questions.append({
+                'game_type': 'money-master',
+                'operation': 'change',
+                'num1': f'Price: {price}¢',
+                'num2': 'change',
+                'text1': 'Paid: $1.00',
+                'answer': f"{change}¢",
+                'option1': f"{change}¢",
+                'option2': f"{change + 5}¢",
+                'option3': f"{change - 5}¢",
+                'option4': f"{change + 10}¢",
+                'difficulty': 'Hard',
+                'hint': f'100 - {price}',
+                'know_more': f'Change is {change}¢.',
+                'image_url': ''
+            })
 
     return questions
 
-def main():
+GENERATORS = [
+    ('fraction-frenzy', generate_fraction_questions),
+    ('geometry-galaxy', generate_geometry_questions),
+    ('money-master', generate_money_questions),
+]
+
+def expand():
     print(f"Reading {OUTPUT_FILE}...")
-    try:
-        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames
-            if 'image_url' not in fieldnames:
-                fieldnames.append('image_url')
-            existing_data = list(reader)
-    except FileNotFoundError:
-        print("File not found, creating new.")
-        existing_data = []
-        fieldnames = ['game_type','num1','num2','operation','answer','option1','option2','option3','option4','difficulty','hint','know_more','image_url','text1','text2','topic','subtopic']
-
-    target_games = {'fraction-frenzy', 'geometry-galaxy', 'money-master'}
+    with PROFILER.stage('read'):
+        try:
+            with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                fieldnames = reader.fieldnames
+                if 'image_url' not in fieldnames:
+                    fieldnames.append('image_url')
+                existing_data = list(reader)
+        except FileNotFoundError:
+            print("File not found, creating new.")
+            existing_data = []
+            fieldnames = ['game_type','num1','num2','operation','answer','option1','option2','option3','option4','difficulty','hint','know_more','image_url','text1','text2','topic','subtopic']
+
+    target_games = {game_type for game_type, _ in GENERATORS}
     kept_data = [row for row in existing_data if row.get('game_type') not in target_games]
 
     new_questions = []
-    new_questions.extend(generate_fraction_questions())
-    new_questions.extend(generate_geometry_questions())
-    new_questions.extend(generate_money_questions())
+    for game_type, generate in GENERATORS:
+        # Sampling time is reported net of the nested distractor search and row formatting
+        with PROFILER.stage('sampling', game_type):
+            questions = generate()
+        PROFILER.add_rows(game_type, len(questions))
+        new_questions.extend(questions)
 
     final_data = kept_data + new_questions
 
@@ -313,18 +341,33 @@ def main():
         final_fieldnames.remove('game_type')
         final_fieldnames.insert(0, 'game_type')
 
-    print(f"Writing {len(final_data)} rows to {OUTPUT_FILE}...")
-    with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=final_fieldnames)
-        writer.writeheader()
+    # Rows are formatted inside the generators ('format'); this only pads them to the shared header
+    with PROFILER.stage('fill_missing'):
         for row in final_data:
             # Fill missing keys
             for field in final_fieldnames:
                 if field not in row:
                     row[field] = ''
-            writer.writerow(row)
 
+    print(f"Writing {len(final_data)} rows to {OUTPUT_FILE}...")
+    with PROFILER.stage('csv_write'):
+        with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=final_fieldnames)
+            writer.writeheader()
+            writer.writerows(final_data)
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate fraction, geometry and money questions.")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    enable_from_args(PROFILER, args)
+    try:
+        expand()
+    finally:
+        # Also report a failed run, with the stage that raised under 'failed'
+        PROFILER.finish(args.profile, args.cprofile)
     print("Done!")
 
+
 if __name__ == "__main__":
     main()
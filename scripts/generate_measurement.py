@@ -0,0 +1,87 @@
+import argparse
+import random
+import sys
+
+from apply_patches import patched_bank
+from data_pipeline import (
+    ROOT, read_csv_records, render_row, shard_path, write_if_changed, write_shard,
+)
+
+sys.path.insert(0, ROOT)
+from unit_conversions import conversion_pool, question_fields, sample_conversions  # noqa: E402
+
+# Replaces the measurement-mission rows of the math bank with questions from unit_conversions.py
+# and rewrites public/games/measurement-mission.csv. Every other row keeps its original text, so
+# the script can be rerun at any time; the same seed gives the same questions.
+#
+#   python scripts/generate_measurement.py               # every conversion in the pool
+#   python scripts/generate_measurement.py --count 200
+
+BANK = 'public/MATH_GOOGLE_SHEET_DATA.csv'
+GAME_TYPE = 'measurement-mission'
+
+
+def measurement_rows(count, seed):
+    rng = random.Random(seed)
+    rows = []
+    for item in sample_conversions(count, rng):
+        q = question_fields(item, rng)
+        options = q['options']
+        rows.append({
+            'game_type': GAME_TYPE,
+            'text1': q['text1'],
+            'answer': q['answer'],
+            'option1': options[0], 'option2': options[1], 'option3': options[2], 'option4': options[3],
+            'know_more': q['know_more'],
+            'hint': q['hint'],
+            'difficulty': q['difficulty'],
+            'operation': q['operation'],
+        })
+    return rows
+
+
+def replace_game_rows(bank, game_type, new_rows):
+    """Bank text with game_type's rows swapped for new_rows, placed where the first old one was."""
+    fieldnames, header, records = read_csv_records(bank)
+    terminator = '\r\n' if header.endswith('\r\n') else '\n'
+    rendered = [render_row(fieldnames, {field: row.get(field, '') for field in fieldnames}, terminator)
+                for row in new_rows]
+
+    out = [header]
+    replaced = 0
+    for row, text in records:
+        if (row.get('game_type') or '').strip() != game_type:
+            out.append(text)
+            continue
+        if not replaced:
+            out.extend(rendered)
+        replaced += 1
+    if not replaced:
+        if out[-1] and not out[-1].endswith(('\n', '\r')):
+            out[-1] += terminator
+        out.extend(rendered)
+    return ''.join(out), replaced
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate the Measurement Mission questions from the unit graph.")
+    parser.add_argument('--count', type=int, default=None,
+                        help=f"Questions to keep, spread over the dimensions (default: all {len(conversion_pool())})")
+    parser.add_argument('--seed', type=int, default=34, help="Random seed, so the output is reproducible")
+    args = parser.parse_args()
+
+    rows = measurement_rows(args.count or len(conversion_pool()), args.seed)
+    text, replaced = replace_game_rows(BANK, GAME_TYPE, rows)
+    changed = write_if_changed(BANK, text)
+    print(f"{'Wrote' if changed else 'Unchanged'} {BANK}: {replaced} {GAME_TYPE} rows replaced by {len(rows)}")
+
+    fieldnames, bank_rows = patched_bank(BANK)
+    game_rows = [row for row in bank_rows if (row.get('game_type') or '').strip() == GAME_TYPE]
+    shard_changed, dropped = write_shard(GAME_TYPE, fieldnames, game_rows)
+    counts = {difficulty: sum(1 for row in game_rows if row['difficulty'] == difficulty) for difficulty in ('Easy', 'Medium', 'Hard')}
+    print(f"{'Wrote' if shard_changed else 'Unchanged'} {shard_path(GAME_TYPE)}: "
+          f"{len(game_rows) - dropped} questions ({', '.join(f'{d} {n}' for d, n in counts.items())})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+import argparse
+import itertools
+import math
+import os
+import random
+from collections import deque
+from functools import lru_cache
+
+from data_pipeline import render_csv, repo_path, write_if_changed
+
+# Generates verified grid puzzles for Memory Matrix and Path Planner into public/puzzles/.
+# Every layout is reduced to a canonical form over the 8 rotations and reflections of the grid,
+# so mirror images are stored once. Each puzzle is solved once here with BFS, so the games
+# only pick a row: no solving and no unsolvable levels on the device.
+#
+# Cells are numbered row by row (index = y * size + x) and cell sets are stored as hex bitmasks.
+# Difficulty is the tercile of a puzzle's solution metrics within its grid (and cell count).
+# The games pick the grid from the chosen difficulty and move up through the terciles as the
+# rounds go on (tierForRound in src/hooks/usePuzzleBank.ts), so every row gets played.
+
+PUZZLES_DIR = 'public/puzzles'
+DIFFICULTY_ORDER = ['Easy', 'Medium', 'Hard']
+
+# Grid size -> smallest pattern shown; later rounds add a cell every two rounds (MemoryMatrixGame)
+MEMORY_BASE_CELLS = {3: 3, 4: 5, 5: 7}
+MEMORY_EXTRA_CELLS = 5
+# Grid size -> (obstacle counts, star counts, max moves); grids and move limits match PathPlannerGame.
+# One obstacle and no stars allow only 44 distinct 3x3 layouts, so 3x3 mixes in a second obstacle
+# and an optional star.
+PATH_CONFIG = {3: ((1, 2), (0, 1), 6), 4: ((2,), (1,), 8), 5: ((4,), (2,), 10)}
+
+ENUMERATE_LIMIT = 20000  # enumerate every layout below this many, sample above it
+
+
+@lru_cache(maxsize=None)
+def symmetries(size):
+    """Cell permutations for the 8 rotations and reflections of a size x size grid."""
+    last = size - 1
+    transforms = [
+        lambda x, y: (x, y), lambda x, y: (last - y, x), lambda x, y: (last - x, last - y), lambda x, y: (y, last - x),
+        lambda x, y: (last - x, y), lambda x, y: (x, last - y), lambda x, y: (y, x), lambda x, y: (last - y, last - x),
+    ]
+    perms = []
+    for transform in transforms:
+        perm = []
+        for cell in range(size * size):
+            x, y = transform(cell % size, cell // size)
+            perm.append(y * size + x)
+        perms.append(tuple(perm))
+    return perms
+
+
+def map_mask(mask, perm):
+    mapped = 0
+    while mask:
+        low = mask & -mask
+        mapped |= 1 << perm[low.bit_length() - 1]
+        mask ^= low
+    return mapped
+
+
+def canonical(size, start=None, goal=None, *masks):
+    """Smallest (start, goal, masks...) over all symmetries."""
+    return min(
+        (None if start is None else perm[start], None if goal is None else perm[goal])
+        + tuple(map_mask(mask, perm) for mask in masks)
+        for perm in symmetries(size)
+    )
+
+
+def cells_of(mask):
+    return [cell for cell in range(mask.bit_length()) if mask >> cell & 1]
+
+
+def neighbours(cell, size):
+    x, y = cell % size, cell // size
+    if y > 0:
+        yield cell - size
+    if x < size - 1:
+        yield cell + 1
+    if y < size - 1:
+        yield cell + size
+    if x > 0:
+        yield cell - 1
+
+
+def count_components(mask, size):
+    remaining = mask
+    components = 0
+    while remaining:
+        components += 1
+        queue = deque([(remaining & -remaining).bit_length() - 1])
+        remaining &= remaining - 1
+        while queue:
+            for neighbour in neighbours(queue.popleft(), size):
+                if remaining >> neighbour & 1:
+                    remaining &= ~(1 << neighbour)
+                    queue.append(neighbour)
+    return components
+
+
+def bounding_area(mask, size):
+    xs = [cell % size for cell in cells_of(mask)]
+    ys = [cell // size for cell in cells_of(mask)]
+    return (max(xs) - min(xs) + 1) * (max(ys) - min(ys) + 1)
+
+
+def solve_path(size, start, goal, obstacles, stars):
+    """BFS over (cell, stars collected); returns (moves to goal, moves to goal with every star) or None."""
+    star_bits = {cell: 1 << i for i, cell in enumerate(cells_of(stars))}
+    all_stars = (1 << len(star_bits)) - 1
+    best_goal = None
+    queue = deque([(start, 0, 0)])
+    visited = {(start, 0)}
+    while queue:
+        cell, collected, moves = queue.popleft()
+        if cell == goal:
+            if best_goal is None:
+                best_goal = moves
+            if collected == all_stars:
+                return best_goal, moves
+        for neighbour in neighbours(cell, size):
+            if obstacles >> neighbour & 1:
+                continue
+            state = (neighbour, collected | star_bits.get(neighbour, 0))
+            if state not in visited:
+                visited.add(state)
+                queue.append((neighbour, state[1], moves + 1))
+    return None
+
+
+def assign_terciles(puzzles, key):
+    """Split puzzles sorted by key into Easy, Medium and Hard thirds."""
+    puzzles.sort(key=key)
+    for i, puzzle in enumerate(puzzles):
+        puzzle['difficulty'] = DIFFICULTY_ORDER[i * len(DIFFICULTY_ORDER) // len(puzzles)]
+    return puzzles
+
+
+def cell_masks(total, count, rng, attempts):
+    if math.comb(total, count) <= ENUMERATE_LIMIT:
+        for cells in itertools.combinations(range(total), count):
+            yield sum(1 << cell for cell in cells)
+    else:
+        for _ in range(attempts):
+            yield sum(1 << cell for cell in rng.sample(range(total), count))
+
+
+def memory_puzzles(limit, rng):
+    rows = []
+    for size, base in MEMORY_BASE_CELLS.items():
+        total = size * size
+        for count in range(base, min(base + MEMORY_EXTRA_CELLS, total - 1) + 1):
+            found = {canonical(size, None, None, mask)[2] for mask in cell_masks(total, count, rng, limit * 20)}
+            masks = rng.sample(sorted(found), min(limit, len(found)))
+            puzzles = [{
+                'size': size,
+                'cells': count,
+                'mask': mask,
+                # Clustered cells are remembered as one shape, so more pieces is harder
+                'components': count_components(mask, size),
+                'spread': bounding_area(mask, size),
+            } for mask in masks]
+            rows.extend(assign_terciles(puzzles, lambda p: (p['components'], p['spread'], p['mask'])))
+    return rows
+
+
+def path_puzzles(limit, rng):
+    rows = []
+    for size, (obstacle_counts, star_counts, max_moves) in PATH_CONFIG.items():
+        total = size * size
+        found = {}
+        valid = 0
+        for _ in range(limit * 50):
+            if valid >= limit:
+                break
+            obstacle_count, star_count = rng.choice(obstacle_counts), rng.choice(star_counts)
+            placed = rng.sample(range(total), 2 + obstacle_count + star_count)
+            start, goal = placed[0], placed[1]
+            obstacles = sum(1 << cell for cell in placed[2:2 + obstacle_count])
+            stars = sum(1 << cell for cell in placed[2 + obstacle_count:])
+            key = canonical(size, start, goal, obstacles, stars)
+            if key in found:
+                continue
+            solution = solve_path(size, *key)
+            if not solution or solution[0] < 2 or solution[1] > max_moves:
+                found[key] = None
+                continue
+            moves, star_moves = solution
+            valid += 1
+            manhattan = abs(key[0] % size - key[1] % size) + abs(key[0] // size - key[1] // size)
+            found[key] = {
+                'size': size,
+                'start': key[0],
+                'goal': key[1],
+                'obstacles': key[2],
+                'stars': key[3],
+                'moves': moves,
+                'star_moves': star_moves,
+                # Moves spent going around obstacles instead of straight to the goal
+                'detour': moves - manhattan,
+            }
+        puzzles = [puzzle for puzzle in found.values() if puzzle]
+        rows.extend(assign_terciles(puzzles, lambda p: (p['star_moves'] + p['detour'], p['moves'], p['start'], p['obstacles'])))
+    return rows
+
+
+def write_puzzles(name, fieldnames, rows, mask_fields):
+    for row in rows:
+        for field in mask_fields:
+            row[field] = format(row[field], 'x')
+    rows.sort(key=lambda row: (row['size'], DIFFICULTY_ORDER.index(row['difficulty'])))
+    rel = f"{PUZZLES_DIR}/{name}.csv"
+    changed = write_if_changed(rel, render_csv(fieldnames, rows))
+    counts = {difficulty: sum(1 for row in rows if row['difficulty'] == difficulty) for difficulty in DIFFICULTY_ORDER}
+    print(f"{'Wrote' if changed else 'Unchanged'} {rel}: {len(rows)} puzzles "
+          f"({', '.join(f'{d} {n}' for d, n in counts.items())})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate verified Memory Matrix and Path Planner puzzles.")
+    parser.add_argument('--count', type=int, default=150, help="Puzzles per grid size (per cell count for Memory Matrix)")
+    parser.add_argument('--seed', type=int, default=7, help="Random seed, so the output is reproducible")
+    args = parser.parse_args()
+
+    os.makedirs(repo_path(PUZZLES_DIR), exist_ok=True)
+
+    rng = random.Random(args.seed)
+    write_puzzles('memory-matrix', ['difficulty', 'size', 'cells', 'mask', 'components', 'spread'],
+                  memory_puzzles(args.count, rng), ['mask'])
+    write_puzzles('path-planner', ['difficulty', 'size', 'start', 'goal', 'obstacles', 'stars', 'moves', 'star_moves', 'detour'],
+                  path_puzzles(args.count, rng), ['obstacles', 'stars'])
+
+
+if __name__ == "__main__":
+    main()
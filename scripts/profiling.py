@@ -0,0 +1,144 @@
+import cProfile
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Opt-in instrumentation for the data generation scripts.
+# A disabled Profiler is a no-op, so generators can call it unconditionally.
+
+
+class Profiler:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.stages = {}      # (game_type, stage) -> {'calls', 'total', 'self'}
+        self.counters = {}    # (game_type, name) -> int
+        self.rows = {}        # game_type -> rows produced
+        self._stack = []      # [game_type, stage, start, child_time]
+        self.failed = None    # innermost stage an exception escaped from
+        self._cprofile = None
+        self._started = None
+
+    def start(self, cprofile=False, memory=False):
+        if not self.enabled:
+            return
+        if memory:
+            # tracemalloc hooks every allocation, so stage timings from a memory run are inflated
+            tracemalloc.start()
+        self._started = time.perf_counter()
+        if cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def current_game_type(self):
+        for frame in reversed(self._stack):
+            if frame[0]:
+                return frame[0]
+        return None
+
+    @contextmanager
+    def stage(self, name, game_type=None):
+        if not self.enabled:
+            yield
+            return
+
+        game_type = game_type or self.current_game_type() or '*'
+        frame = [game_type, name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        except BaseException as e:
+            if self.failed is None:
+                self.failed = {'game_type': game_type, 'stage': name, 'error': f"{type(e).__name__}: {e}"}
+            raise
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[2]
+            # Self time excludes nested stages so sampling and distractor search don't double count
+            if self._stack:
+                self._stack[-1][3] += elapsed
+            entry = self.stages.setdefault((game_type, name), {'calls': 0, 'total': 0.0, 'self': 0.0})
+            entry['calls'] += 1
+            entry['total'] += elapsed
+            entry['self'] += elapsed - frame[3]
+
+    def count(self, name, amount=1, game_type=None):
+        if not self.enabled:
+            return
+        key = (game_type or self.current_game_type() or '*', name)
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def add_rows(self, game_type, amount):
+        if not self.enabled:
+            return
+        self.rows[game_type] = self.rows.get(game_type, 0) + amount
+
+    def report(self):
+        wall = time.perf_counter() - self._started if self._started else 0.0
+        tracing = tracemalloc.is_tracing()
+        _, peak = tracemalloc.get_traced_memory() if tracing else (0, None)
+
+        games = {}
+        for (game_type, name), entry in sorted(self.stages.items()):
+            game = games.setdefault(game_type, {'stages': {}, 'counters': {}})
+            game['stages'][name] = {
+                'calls': entry['calls'],
+                'total_ms': round(entry['total'] * 1000, 3),
+                'self_ms': round(entry['self'] * 1000, 3),
+            }
+        for (game_type, name), value in sorted(self.counters.items()):
+            games.setdefault(game_type, {'stages': {}, 'counters': {}})['counters'][name] = value
+        for game_type, rows in self.rows.items():
+            game = games.setdefault(game_type, {'stages': {}, 'counters': {}})
+            busy = sum(entry['self_ms'] for entry in game['stages'].values()) / 1000
+            game['rows'] = rows
+            game['rows_per_sec'] = round(rows / busy, 1) if busy else None
+
+        total_rows = sum(self.rows.values())
+        return {
+            'wall_ms': round(wall * 1000, 3),
+            'rows': total_rows,
+            'rows_per_sec': round(total_rows / wall, 1) if wall else None,
+            'peak_memory_bytes': peak,
+            'memory_traced': tracing,
+            'failed': self.failed,
+            'games': games,
+        }
+
+    def finish(self, output=None, cprofile_output=None):
+        if not self.enabled:
+            return None
+        if self._cprofile:
+            self._cprofile.disable()
+            if cprofile_output:
+                # Load with `python -m pstats`, snakeviz or flameprof to get a flamegraph
+                self._cprofile.dump_stats(cprofile_output)
+                print(f"cProfile stats written to {cprofile_output}", file=sys.stderr)
+
+        report = self.report()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+        text = json.dumps(report, indent=2)
+        if output and output != '-':
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write(text + '\n')
+            print(f"Profile written to {output}", file=sys.stderr)
+        else:
+            print(text, file=sys.stderr)
+        return report
+
+
+def add_profile_arguments(parser):
+    parser.add_argument('--profile', nargs='?', const='-', metavar='PATH',
+                        help="Write a JSON timing report to PATH (stderr if omitted)")
+    parser.add_argument('--cprofile', metavar='PATH',
+                        help="Also dump cProfile stats to PATH")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="Record peak memory with tracemalloc (slows every stage; use a separate run for timings)")
+
+
+def enable_from_args(profiler, args):
+    profiler.enabled = bool(args.profile or args.cprofile or args.profile_memory)
+    profiler.start(cprofile=bool(args.cprofile), memory=args.profile_memory)
@@ -0,0 +1,246 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import sqlite3
+import sys
+
+from data_pipeline import GAMES_DIR, ROOT, read_csv, render_csv, repo_path, write_if_changed
+
+# Optional SQLite copy of the question banks for indexed filtering and search.
+# The CSVs stay the source of truth; import/export round-trips them with their original headers.
+
+DEFAULT_DB = 'questions.db'
+DEFAULT_EXPORT_DIR = 'exported'
+INDEXED_FIELDS = ['game_type', 'difficulty', 'operation']
+SEARCH_FIELDS = ['text1', 'text2', 'hint']
+COLUMN_RE = re.compile(r'^[a-z_][a-z0-9_]*$')
+
+
+def quote(column):
+    if not COLUMN_RE.match(column):
+        raise ValueError(f"Unsupported column name: {column!r}")
+    return f'"{column}"'
+
+
+class QuestionStore:
+    def __init__(self, path=DEFAULT_DB):
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS sources (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                fieldnames TEXT NOT NULL,
+                malformed INTEGER NOT NULL DEFAULT 0
+            )""")
+        if 'malformed' not in [row['name'] for row in self.conn.execute("PRAGMA table_info(sources)")]:
+            # Databases created before malformed rows were tracked
+            self.conn.execute("ALTER TABLE sources ADD COLUMN malformed INTEGER NOT NULL DEFAULT 0")
+        columns = ', '.join(f"{quote(field)} TEXT NOT NULL DEFAULT ''" for field in INDEXED_FIELDS + SEARCH_FIELDS)
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS questions (
+                id INTEGER PRIMARY KEY,
+                source_id INTEGER NOT NULL REFERENCES sources(id),
+                position INTEGER NOT NULL,
+                {columns}
+            )""")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_questions_source ON questions(source_id, position)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_questions_game_type ON questions(game_type, difficulty)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_questions_difficulty ON questions(difficulty)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_questions_operation ON questions(operation)")
+        self.has_fts = self._create_fts()
+        self.conn.commit()
+
+    def _create_fts(self):
+        try:
+            self.conn.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts
+                USING fts5({', '.join(SEARCH_FIELDS)}, content='questions', content_rowid='id')""")
+            return True
+        except sqlite3.OperationalError:
+            # Some SQLite builds ship without FTS5; search falls back to LIKE scans
+            print("SQLite FTS5 not available, text search will scan", file=sys.stderr)
+            return False
+
+    def close(self):
+        self.conn.close()
+
+    def columns(self):
+        return [row['name'] for row in self.conn.execute("PRAGMA table_info(questions)")]
+
+    def ensure_columns(self, fieldnames):
+        existing = set(self.columns())
+        for field in fieldnames:
+            if field not in existing:
+                self.conn.execute(f"ALTER TABLE questions ADD COLUMN {quote(field)} TEXT NOT NULL DEFAULT ''")
+                existing.add(field)
+
+    def rebuild_search_index(self):
+        if self.has_fts:
+            self.conn.execute("INSERT INTO questions_fts(questions_fts) VALUES('rebuild')")
+
+    def import_csv(self, rel_path, rebuild_index=True):
+        fieldnames, rows = read_csv(rel_path)
+        fieldnames = [field for field in fieldnames if field]
+        overflow = sum(1 for row in rows if None in row)
+        if overflow:
+            print(f"  {rel_path}: ignoring extra fields on {overflow} malformed row(s)", file=sys.stderr)
+
+        with self.conn:
+            self.ensure_columns(fieldnames)
+            self.conn.execute(
+                "INSERT INTO sources(path, fieldnames, malformed) VALUES (?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET fieldnames = excluded.fieldnames, malformed = excluded.malformed",
+                (rel_path, json.dumps(fieldnames), overflow))
+            source_id = self.conn.execute("SELECT id FROM sources WHERE path = ?", (rel_path,)).fetchone()['id']
+            self.conn.execute("DELETE FROM questions WHERE source_id = ?", (source_id,))
+
+            columns = ', '.join(quote(field) for field in fieldnames)
+            placeholders = ', '.join('?' for _ in fieldnames)
+            self.conn.executemany(
+                f"INSERT INTO questions(source_id, position, {columns}) VALUES (?, ?, {placeholders})",
+                ((source_id, position, *(row.get(field) or '' for field in fieldnames))
+                 for position, row in enumerate(rows)))
+            if rebuild_index:
+                self.rebuild_search_index()
+        return len(rows)
+
+    def import_all(self, rel_paths):
+        total = 0
+        for rel_path in rel_paths:
+            total += self.import_csv(rel_path, rebuild_index=False)
+        with self.conn:
+            self.rebuild_search_index()
+        return total
+
+    def export_csv(self, rel_path, out_dir=None):
+        source = self.conn.execute("SELECT id, fieldnames, malformed FROM sources WHERE path = ?", (rel_path,)).fetchone()
+        if source is None:
+            raise KeyError(f"{rel_path} has not been imported")
+        if source['malformed']:
+            # The extra fields were never stored, so writing this source would lose them
+            raise ValueError(f"{rel_path} had {source['malformed']} row(s) with extra fields when imported; "
+                             "fix the CSV and import it again")
+        fieldnames = json.loads(source['fieldnames'])
+        rows = self.conn.execute(
+            f"SELECT {', '.join(quote(field) for field in fieldnames)} FROM questions "
+            "WHERE source_id = ? ORDER BY position", (source['id'],))
+        target = os.path.join(out_dir, rel_path) if out_dir else rel_path
+        if out_dir:
+            os.makedirs(os.path.dirname(repo_path(target)), exist_ok=True)
+        return write_if_changed(target, render_csv(fieldnames, [dict(row) for row in rows]))
+
+    def sources(self):
+        return [row['path'] for row in self.conn.execute("SELECT path FROM sources ORDER BY path")]
+
+    def _filter(self, game_type, difficulty, operation, search):
+        clauses = []
+        params = []
+        for field, value in (('game_type', game_type), ('difficulty', difficulty), ('operation', operation)):
+            if value:
+                clauses.append(f"q.{field} = ?")
+                params.append(value)
+
+        source = "questions q"
+        if search and self.has_fts:
+            source = "questions_fts f JOIN questions q ON q.id = f.rowid"
+            clauses.append("questions_fts MATCH ?")
+            # Search as a phrase, so input like "Max?" or "don't" is not parsed as FTS5 query syntax
+            params.append('"' + search.replace('"', '""') + '"')
+        elif search:
+            clauses.append('(' + ' OR '.join(f"q.{field} LIKE ?" for field in SEARCH_FIELDS) + ')')
+            params.extend([f"%{search}%"] * len(SEARCH_FIELDS))
+
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return source, where, params
+
+    def count(self, game_type=None, difficulty=None, operation=None, search=None):
+        source, where, params = self._filter(game_type, difficulty, operation, search)
+        return self.conn.execute(f"SELECT COUNT(*) FROM {source}{where}", params).fetchone()[0]
+
+    def query(self, game_type=None, difficulty=None, operation=None, search=None, sample=None, limit=None):
+        source, where, params = self._filter(game_type, difficulty, operation, search)
+        sql = f"SELECT q.* FROM {source}{where}"
+        if sample:
+            sql += " ORDER BY random() LIMIT ?"
+            params.append(sample)
+        else:
+            sql += " ORDER BY q.source_id, q.position"
+            if limit:
+                sql += " LIMIT ?"
+                params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+
+def default_sources():
+    # The per-game files cover every game, including the ones that only exist as a per-game file
+    return sorted(os.path.relpath(path, ROOT) for path in glob.glob(repo_path(f"{GAMES_DIR}/*.csv")))
+
+
+def output_fields(store, rows):
+    internal = {'id', 'source_id', 'position'}
+    used = [column for column in store.columns() if column not in internal and any(row.get(column) for row in rows)]
+    return used or ['game_type']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite store for the question banks.")
+    parser.add_argument('--db', default=DEFAULT_DB, help=f"Database path (default: {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_cmd = commands.add_parser('import', help="Load CSVs into the store")
+    import_cmd.add_argument('paths', nargs='*', help="CSV paths relative to the repo root (default: public/games/*.csv)")
+
+    export_cmd = commands.add_parser('export', help="Write imported CSVs back out")
+    export_cmd.add_argument('paths', nargs='*', help="Sources to export (default: all)")
+    export_cmd.add_argument('--out', default=DEFAULT_EXPORT_DIR, help=f"Output directory (default: {DEFAULT_EXPORT_DIR}/)")
+    export_cmd.add_argument('--in-place', action='store_true', help="Overwrite the source CSVs instead")
+
+    query_cmd = commands.add_parser('query', help="Filter, search or sample questions")
+    query_cmd.add_argument('--game-type')
+    query_cmd.add_argument('--difficulty')
+    query_cmd.add_argument('--operation')
+    query_cmd.add_argument('--search', help="Full-text search over text1, text2 and hint")
+    query_cmd.add_argument('--sample', type=int, help="Return N random matches")
+    query_cmd.add_argument('--limit', type=int)
+    query_cmd.add_argument('--count', action='store_true', help="Only print the number of matches")
+
+    args = parser.parse_args()
+    store = QuestionStore(args.db)
+    try:
+        if args.command == 'import':
+            paths = args.paths or default_sources()
+            total = store.import_all(paths)
+            print(f"Imported {total} rows from {len(paths)} file(s) into {args.db}")
+        elif args.command == 'export':
+            paths = args.paths or store.sources()
+            written = 0
+            refused = 0
+            for path in paths:
+                try:
+                    written += store.export_csv(path, None if args.in_place else args.out)
+                except ValueError as e:
+                    print(f"Skipped: {e}", file=sys.stderr)
+                    refused += 1
+            target = "in place" if args.in_place else f"to {args.out}/"
+            print(f"Exported {len(paths) - refused} file(s) {target}, {written} changed")
+            if refused:
+                sys.exit(1)
+        elif args.count:
+            print(store.count(args.game_type, args.difficulty, args.operation, args.search))
+        else:
+            rows = store.query(args.game_type, args.difficulty, args.operation, args.search, args.sample, args.limit)
+            fields = output_fields(store, rows)
+            writer = csv.DictWriter(sys.stdout, fieldnames=fields, extrasaction='ignore', lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
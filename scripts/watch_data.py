@@ -0,0 +1,291 @@
+import argparse
+import os
+import sys
+import time
+
+from apply_patches import PATCHES_DIR, PatchError, layer_dirs, layer_paths, patched_bank
+from build_precache_manifest import MANIFEST_FILE, write_manifest
+from data_pipeline import (
+    GAMES_DIR, GAME_TYPE_RE, PUBLIC_BANKS, ROOT_BANKS, SOURCE_ONLY,
+    assign_row_ids, fingerprint_game_types, group_by_game_type, read_csv, read_csv_records,
+    render_row, repo_path, shard_path, validate_rows, write_if_changed, write_shard,
+)
+
+# Watches the authoring CSVs and rebuilds only what an edit affects:
+#   root bank     -> carry the added, edited and removed rows into the public bank -> shard
+#   public bank   -> apply patch layers + validate + dedup + shard the changed game_types
+#   patch layer   -> re-apply the bank's layers -> shard
+#   per-game file -> validate
+# The precache manifest is refreshed after each change.
+# Files are polled by mtime, so there is nothing to install.
+
+
+def rows_by_id(rows):
+    return dict(zip(assign_row_ids(rows), rows))
+
+
+def same_row(a, b, fields):
+    return all((a.get(field) or '') == (b.get(field) or '') for field in fields)
+
+
+def merge_root_changes(public_path, old_root, new_root, root_fields):
+    """Carry row-level root edits into the public bank; returns (text or None if unchanged, summary, unmatched).
+
+    The public bank has rows the root bank lacks, so only rows whose id was added, edited or removed in
+    the root bank are touched. Every other record keeps its original text, quoting and line ending.
+    An edited root row whose id has no public copy is not a new question, so it is returned in
+    unmatched instead of being added.
+    """
+    fieldnames, header, records = read_csv_records(public_path)
+    fields = [field for field in root_fields if field in fieldnames]
+    missing = [field for field in root_fields if field not in fieldnames]
+    terminator = '\r\n' if header.endswith('\r\n') else '\n'
+    public_ids = {rid: position for position, rid in enumerate(assign_row_ids([row for row, _ in records]))}
+
+    texts = [text for _, text in records]
+    inserts = {}   # position to insert after (-1: end of file) -> [text]
+    summary = {'added': 0, 'updated': 0, 'removed': 0, 'kept': 0, 'unmatched': 0}
+    unmatched = []
+
+    for rid, row in new_root.items():
+        if rid in old_root and same_row(old_root[rid], row, root_fields):
+            continue
+        if any(row.get(field) for field in missing):
+            raise ValueError(f"{public_path} has no column for {', '.join(f for f in missing if row.get(f))}; "
+                             "add it there first")
+        if rid in public_ids:
+            position = public_ids[rid]
+            if not same_row(records[position][0], row, fields):
+                texts[position] = render_row(fieldnames, {**records[position][0], **{f: row.get(f) or '' for f in fields}}, terminator)
+                summary['updated'] += 1
+            continue
+        if rid in old_root:
+            # Edited in root, but the public copy differs (or never existed); adding it would duplicate it
+            unmatched.append(row)
+            summary['unmatched'] += 1
+            continue
+        # New question: place it after the last public row of its game_type
+        game_type = row.get('game_type') or ''
+        anchor = max((position for position, (public_row, _) in enumerate(records)
+                      if (public_row.get('game_type') or '') == game_type), default=-1)
+        inserts.setdefault(anchor, []).append(render_row(fieldnames, row, terminator))
+        summary['added'] += 1
+
+    for rid, row in old_root.items():
+        if rid in new_root or rid not in public_ids:
+            continue
+        position = public_ids[rid]
+        if same_row(records[position][0], row, fields):
+            texts[position] = ''
+            summary['removed'] += 1
+        else:
+            # Edited in public since the last sync; that copy wins
+            summary['kept'] += 1
+
+    if not any(summary[key] for key in ('added', 'updated', 'removed')):
+        return None, summary, unmatched
+
+    out = [header]
+    for position, text in enumerate(texts):
+        out.append(text)
+        for added in inserts.get(position, []):
+            if out[-1] and not out[-1].endswith(('\n', '\r')):
+                out[-1] += terminator
+            out.append(added)
+    for added in inserts.get(-1, []):
+        if out[-1] and not out[-1].endswith(('\n', '\r')):
+            out[-1] += terminator
+        out.append(added)
+    return ''.join(out), summary, unmatched
+
+
+class DataWatcher:
+    def __init__(self):
+        self.stamps = {}
+        self.snapshots = {}   # bank path -> {game_type: fingerprint}
+        self.root_rows = {}   # root bank path -> {row id: row} as of the last sync
+        self.derived = {}     # shard path -> public bank it is generated from
+
+    def paths(self):
+        paths = list(ROOT_BANKS) + SOURCE_ONLY + PUBLIC_BANKS
+        games_dir = repo_path(GAMES_DIR)
+        if os.path.isdir(games_dir):
+            paths += sorted(f"{GAMES_DIR}/{name}" for name in os.listdir(games_dir) if name.endswith('.csv'))
+        for bank_dir in layer_dirs():
+            paths += layer_paths(bank_dir)
+        return paths
+
+    def stamp(self, path):
+        try:
+            st = os.stat(repo_path(path))
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh_stamp(self, path):
+        self.stamps[path] = self.stamp(path)
+
+    def prime(self):
+        for path in self.paths():
+            self.refresh_stamp(path)
+            if path in ROOT_BANKS:
+                fieldnames, rows = read_csv(path)
+                self.changed_game_types(path, fieldnames, rows)
+                self.root_rows[path] = rows_by_id(rows)
+            elif path in PUBLIC_BANKS:
+                try:
+                    self.changed_game_types(path, *patched_bank(path))
+                except PatchError as e:
+                    print(f"  ! {e}")
+        for bank in PUBLIC_BANKS:
+            for game_type in self.snapshots.get(bank, {}):
+                self.derived[shard_path(game_type)] = bank
+
+    def changed_game_types(self, path, fieldnames, rows):
+        new = fingerprint_game_types(fieldnames, rows)
+        old = self.snapshots.get(path, {})
+        self.snapshots[path] = new
+        return sorted(game_type for game_type in new.keys() | old.keys() if new.get(game_type) != old.get(game_type))
+
+    def report(self, problems):
+        for problem in problems:
+            print(f"  ! {problem}")
+
+    def on_root_bank(self, path):
+        root_fields, root_rows = read_csv(path)
+        previous = self.snapshots.get(path, {})
+        game_types = self.changed_game_types(path, root_fields, root_rows)
+        if not game_types:
+            return
+        self.report(validate_rows(root_rows, path))
+
+        old_root = self.root_rows.get(path, {})
+        new_root = rows_by_id(root_rows)
+        changed = [row for rid, row in new_root.items() if rid not in old_root or row != old_root[rid]]
+        if any(None in row for row in changed):
+            # Rewriting would silently drop the overflow fields, so leave the files for a human to fix
+            print(f"  malformed rows in {path}, not syncing {', '.join(game_types)}")
+            # Keep the old snapshot so these rows sync once they are fixed
+            self.snapshots[path] = previous
+            return
+
+        public_path = ROOT_BANKS[path]
+        try:
+            merged = merge_root_changes(public_path, old_root, new_root, root_fields)
+        except ValueError as e:
+            print(f"  ! {e}")
+            self.snapshots[path] = previous
+            return
+        self.root_rows[path] = new_root
+        text, summary, unmatched = merged
+        for row in unmatched:
+            print(f"  ! edited row has no copy in {public_path}, not synced: "
+                  f"{row.get('game_type', '')} {row.get('text1') or row.get('num1') or ''}".rstrip())
+        if text and write_if_changed(public_path, text):
+            print(f"  synced {', '.join(game_types)} -> {public_path}: "
+                  + ', '.join(f"{count} {key}" for key, count in summary.items() if count))
+            self.refresh_stamp(public_path)
+            self.on_public_bank(public_path)
+
+    def on_public_bank(self, path):
+        try:
+            fieldnames, rows = patched_bank(path)
+        except PatchError as e:
+            print(f"  ! {e}")
+            return
+        game_types = self.changed_game_types(path, fieldnames, rows)
+        groups = group_by_game_type(rows)
+        for game_type in game_types:
+            if game_type not in groups:
+                print(f"  {game_type} no longer in {path}, leaving {shard_path(game_type)} as is")
+                continue
+            if not GAME_TYPE_RE.match(game_type):
+                self.report(validate_rows(groups[game_type], path)[:1])
+                continue
+            self.report(validate_rows(groups[game_type], f"{path}[{game_type}]"))
+            changed, dropped = write_shard(game_type, fieldnames, groups[game_type])
+            if dropped:
+                print(f"  dropped {dropped} duplicate row(s) from {game_type}")
+            if changed:
+                print(f"  wrote {shard_path(game_type)}")
+            self.derived[shard_path(game_type)] = path
+            self.refresh_stamp(shard_path(game_type))
+
+    def on_patch_layer(self, path):
+        bank = f"public/{path.split('/')[1]}.csv"
+        if bank not in PUBLIC_BANKS:
+            print(f"  ! {path} does not match a bank in public/")
+            return
+        self.on_public_bank(bank)
+
+    def on_game_file(self, path):
+        if path in self.derived:
+            print(f"  {path} is generated from {self.derived[path]}; edits there will overwrite it")
+        if self.stamps.get(path) is None:
+            return
+        self.report(validate_rows(read_csv(path)[1], path))
+
+    def handle(self, path):
+        start = time.perf_counter()
+        print(f"{path} changed")
+        if path in ROOT_BANKS:
+            self.on_root_bank(path)
+        elif path in PUBLIC_BANKS:
+            self.on_public_bank(path)
+        elif path in SOURCE_ONLY:
+            self.report(validate_rows(read_csv(path)[1], path))
+        elif path.startswith(PATCHES_DIR + '/'):
+            self.on_patch_layer(path)
+        else:
+            self.on_game_file(path)
+        if write_manifest()[1]:
+            print(f"  updated {MANIFEST_FILE}")
+        print(f"  done in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    def poll(self):
+        for path in self.paths():
+            stamp = self.stamp(path)
+            if stamp == self.stamps.get(path):
+                continue
+            self.stamps[path] = stamp
+            try:
+                self.handle(path)
+            except (OSError, UnicodeDecodeError) as e:
+                # Editors often save in several steps; the next change event will retry
+                print(f"  could not process {path}: {e}")
+
+    def build_all(self):
+        # Full rebuild of every shard from the public banks; root banks are not synced here
+        for bank in PUBLIC_BANKS:
+            self.snapshots.pop(bank, None)
+            self.on_public_bank(bank)
+        for path in SOURCE_ONLY:
+            self.report(validate_rows(read_csv(path)[1], path))
+        write_manifest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild question bank artifacts when the CSVs change.")
+    parser.add_argument('--once', action='store_true', help="Rebuild all shards once and exit")
+    parser.add_argument('--interval', type=float, default=0.2, help="Polling interval in seconds")
+    args = parser.parse_args()
+
+    watcher = DataWatcher()
+    watcher.prime()
+
+    if args.once:
+        watcher.build_all()
+        return
+
+    print(f"Watching {len(watcher.stamps)} files (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(args.interval)
+            watcher.poll()
+    except KeyboardInterrupt:
+        print("Stopped.")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import { Header } from '../shared/Header';
 import { GameOverScreen } from '../shared/GameOverScreen';
 import { useAppContext } from '../../contexts/AppContext';
 import { Difficulty } from '../../types';
+import { usePuzzleBank, pickPuzzle, maskCells, randomSymmetry } from '../../hooks/usePuzzleBank';
 
 interface MemoryMatrixGameProps {
     onBack: () => void;
@@ -12,6 +13,7 @@ interface MemoryMatrixGameProps {
 
 export const MemoryMatrixGame: React.FC<MemoryMatrixGameProps> = ({ onBack, difficulty }) => {
     const { addLeaderboardEntry } = useAppContext();
+    const puzzles = usePuzzleBank('memory-matrix');
 
     // Grid size based on difficulty
     // Grid size state
@@ -31,7 +33,7 @@ export const MemoryMatrixGame: React.FC<MemoryMatrixGameProps> = ({ onBack, diff
     const [scoreSaved, setScoreSaved] = useState(false);
 
     // Generate random cells to highlight
-    const generatePattern = useCallback(() => {
+    const generatePattern = useCallback((patternRound: number) => {
         // Determine difficulty for this round
         let currentDifficulty = difficulty;
         if (difficulty === 'None') {
@@ -48,18 +50,25 @@ export const MemoryMatrixGame: React.FC<MemoryMatrixGameProps> = ({ onBack, diff
 
         const cells: number[] = [];
         const totalCells = currentGridSize * currentGridSize;
-        const count = Math.min(currentCellsToRemember + Math.floor(round / 2), totalCells - 1);
+        const count = Math.min(currentCellsToRemember + Math.floor(patternRound / 2), totalCells - 1);
+
+        // Prefer a generated pattern; later rounds get more scattered shapes (clustered ones are easier to remember)
+        const puzzle = pickPuzzle(puzzles, p => Number(p.size) === currentGridSize && Number(p.cells) === count, patternRound);
+        if (puzzle) {
+            const transform = randomSymmetry(currentGridSize);
+            return { cells: maskCells(puzzle.mask).map(transform), gridSize: currentGridSize };
+        }
 
         while (cells.length < count) {
             const cell = Math.floor(Math.random() * totalCells);
             if (!cells.includes(cell)) cells.push(cell);
         }
         return { cells, gridSize: currentGridSize };
-    }, [difficulty, round]);
+    }, [difficulty, puzzles]);
 
     // Start a new round
-    const startRound = useCallback(() => {
-        const { cells, gridSize } = generatePattern();
+    const startRound = useCallback((patternRound: number) => {
+        const { cells, gridSize } = generatePattern(patternRound);
         setHighlightedCells(cells);
         setCurrentGridSize(gridSize);
         setSelectedCells([]);
@@ -80,7 +89,7 @@ export const MemoryMatrixGame: React.FC<MemoryMatrixGameProps> = ({ onBack, diff
         setTimer(60);
         setScoreSaved(false);
         setShowTime(3000);
-        startRound();
+        startRound(1);
     };
 
     // Handle cell click
@@ -113,17 +122,17 @@ export const MemoryMatrixGame: React.FC<MemoryMatrixGameProps> = ({ onBack, diff
 
             // Next round
             setTimeout(() => {
-                setRound(r => r + 1);
+                setRound(round + 1);
                 setShowTime(t => Math.max(1500, t - 200)); // Decrease show time
-                startRound();
+                startRound(round + 1);
             }, 1500);
         } else {
             setStreak(0);
             setGameState('result');
 
             setTimeout(() => {
-                setRound(r => r + 1);
-                startRound();
+                setRound(round + 1);
+                startRound(round + 1);
             }, 2000);
         }
     };
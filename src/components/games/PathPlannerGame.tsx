@@ -4,6 +4,7 @@ import { Header } from '../shared/Header';
 import { GameOverScreen } from '../shared/GameOverScreen';
 import { useAppContext } from '../../contexts/AppContext';
 import { Difficulty } from '../../types';
+import { usePuzzleBank, pickPuzzle, maskCells, randomSymmetry } from '../../hooks/usePuzzleBank';
 
 interface PathPlannerGameProps {
     onBack: () => void;
@@ -17,6 +18,7 @@ const DIRECTIONS: Direction[] = ['⬆️', '➡️', '⬇️', '⬅️'];
 
 export const PathPlannerGame: React.FC<PathPlannerGameProps> = ({ onBack, difficulty }) => {
     const { addLeaderboardEntry } = useAppContext();
+    const puzzles = usePuzzleBank('path-planner');
 
     const [currentGridSize, setCurrentGridSize] = useState(difficulty === 'Hard' ? 5 : difficulty === 'Medium' ? 4 : 3);
     const [currentMaxMoves, setCurrentMaxMoves] = useState(difficulty === 'Hard' ? 10 : difficulty === 'Medium' ? 8 : 6);
@@ -38,7 +40,7 @@ export const PathPlannerGame: React.FC<PathPlannerGameProps> = ({ onBack, diffic
     const [feedback, setFeedback] = useState<'success' | 'fail' | null>(null);
 
     // Generate level
-    const generateLevel = () => {
+    const generateLevel = (levelRound: number) => {
         let effectiveDifficulty = difficulty;
         if (difficulty === 'None') {
             const difficulties: Difficulty[] = ['Easy', 'Medium', 'Hard'];
@@ -55,6 +57,30 @@ export const PathPlannerGame: React.FC<PathPlannerGameProps> = ({ onBack, diffic
             Array(gSize).fill('empty')
         );
 
+        // Prefer a pre-solved puzzle: always solvable, with every star reachable within the move limit
+        const puzzle = pickPuzzle(puzzles, p => Number(p.size) === gSize, levelRound);
+        if (puzzle) {
+            const transform = randomSymmetry(gSize);
+            const place = (cell: number, value: Cell) => {
+                const t = transform(cell);
+                newGrid[Math.floor(t / gSize)][t % gSize] = value;
+                return { x: t % gSize, y: Math.floor(t / gSize) };
+            };
+            const start = place(Number(puzzle.start), 'robot');
+            const goal = place(Number(puzzle.goal), 'goal');
+            maskCells(puzzle.obstacles).forEach(cell => place(cell, 'obstacle'));
+            maskCells(puzzle.stars).forEach(cell => place(cell, 'star'));
+
+            setGrid(newGrid);
+            setRobotPos(start);
+            setGoalPos(goal);
+            setCommands([]);
+            setCurrentCommandIndex(-1);
+            setStarsCollected(0);
+            setFeedback(null);
+            return;
+        }
+
         // Place robot (bottom-left area)
         const startX = Math.floor(Math.random() * 2);
         const startY = gSize - 1 - Math.floor(Math.random() * 2);
@@ -101,8 +127,8 @@ export const PathPlannerGame: React.FC<PathPlannerGameProps> = ({ onBack, diffic
     };
 
     // Start round
-    const startRound = () => {
-        generateLevel();
+    const startRound = (levelRound: number) => {
+        generateLevel(levelRound);
         setGameState('planning');
     };
 
@@ -114,7 +140,7 @@ export const PathPlannerGame: React.FC<PathPlannerGameProps> = ({ onBack, diffic
         setMaxStreak(0);
         setTimer(120);
         setScoreSaved(false);
-        startRound();
+        startRound(1);
     };
 
     // Add command
@@ -167,8 +193,8 @@ export const PathPlannerGame: React.FC<PathPlannerGameProps> = ({ onBack, diffic
 
             setGameState('result');
             setTimeout(() => {
-                setRound(r => r + 1);
-                startRound();
+                setRound(round + 1);
+                startRound(round + 1);
             }, 2000);
             return;
         }
@@ -192,8 +218,8 @@ export const PathPlannerGame: React.FC<PathPlannerGameProps> = ({ onBack, diffic
                 setFeedback('fail');
                 setGameState('result');
                 setTimeout(() => {
-                    setRound(r => r + 1);
-                    startRound();
+                    setRound(round + 1);
+                    startRound(round + 1);
                 }, 2000);
                 return;
             }
@@ -221,7 +247,7 @@ export const PathPlannerGame: React.FC<PathPlannerGameProps> = ({ onBack, diffic
         }, 500);
 
         return () => clearTimeout(timer);
-    }, [gameState, currentCommandIndex, commands, robotPos, goalPos, grid, difficulty, currentMaxMoves, currentGridSize, starsCollected]);
+    }, [gameState, currentCommandIndex, commands, robotPos, goalPos, grid, difficulty, currentMaxMoves, currentGridSize, starsCollected, round]);
 
     // Timer countdown
     useEffect(() => {
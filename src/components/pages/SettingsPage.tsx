@@ -1,9 +1,10 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import { SpaceBackground } from '../shared/SpaceBackground';
 import { Settings, Difficulty } from '../../types';
 import { DEFAULT_SETTINGS } from '../../data/gameDefinitions';
 import { useTheme, THEMES } from '../../contexts/ThemeContext';
 import { MATH_GAMES, GRAMMAR_GAMES, SKILL_GAMES, EXAM_GAMES } from '../../data/gameDefinitions';
+import { childKey, downloadHistory, listChildren } from '../../utils/questionHistory';
 
 interface SettingsPageProps {
     settings: Settings;
@@ -48,6 +49,11 @@ export const SettingsPage: React.FC<SettingsPageProps> = ({ settings, setSetting
     const [saveMessage, setSaveMessage] = useState('');
     const [showUrls, setShowUrls] = useState(false);
     const [testingUrl, setTestingUrl] = useState<string | null>(null);
+    const [children, setChildren] = useState<string[]>([]);
+
+    useEffect(() => {
+        if (isUnlocked) listChildren().then(setChildren);
+    }, [isUnlocked]);
 
     const SETTINGS_PASSWORD = import.meta.env.VITE_SETTINGS_PASSWORD || 'Superdad';
     // Static version stamp for this build
@@ -411,6 +417,43 @@ export const SettingsPage: React.FC<SettingsPageProps> = ({ settings, setSetting
                         </div>
                     </div>
 
+                    {/* Question History */}
+                    <div className="bg-gray-900/80 rounded-2xl p-6 backdrop-blur">
+                        <h2 className="text-xl font-bold text-white mb-4">📈 Question History</h2>
+                        <div className="space-y-4">
+                            <div>
+                                <label className="block text-white font-bold mb-2 text-sm">🧒 Child Playing on This Device</label>
+                                <input
+                                    type="text"
+                                    placeholder="Name (leave empty for a shared history)"
+                                    value={localSettings.childName || ''}
+                                    onChange={(e) => setLocalSettings({ ...localSettings, childName: e.target.value })}
+                                    className="w-full px-4 py-3 rounded-lg bg-gray-700 text-white border border-gray-600 focus:border-yellow-500 focus:outline-none text-sm"
+                                />
+                                <p className="text-gray-400 text-xs mt-1">Each child gets their own record of answered questions</p>
+                            </div>
+                            {children.length === 0 ? (
+                                <p className="text-gray-400 text-sm">No questions answered yet.</p>
+                            ) : (
+                                <div className="space-y-2">
+                                    {children.map(child => (
+                                        <div key={child} className="flex items-center justify-between py-1">
+                                            <span className="text-gray-300 text-sm">
+                                                {child}{child === childKey(localSettings.childName) ? ' (current)' : ''}
+                                            </span>
+                                            <button
+                                                onClick={() => downloadHistory(child)}
+                                                className="px-4 py-2 rounded-lg bg-blue-600 text-white hover:bg-blue-500 transition-colors cursor-pointer text-sm"
+                                            >
+                                                ⬇️ Download
+                                            </button>
+                                        </div>
+                                    ))}
+                                </div>
+                            )}
+                        </div>
+                    </div>
+
                     {/* Integration Settings */}
                     <div className="bg-gray-900/80 rounded-2xl p-6 backdrop-blur">
                         <h2 className="text-xl font-bold text-white mb-4">📊 Integration</h2>
@@ -660,7 +660,7 @@ export const SheetBasedGame: React.FC<SheetBasedGameProps> = ({ onBack, difficul
             );
         }
 
-        // Measurement Mission - Length, weight, capacity
+        // Measurement Mission - Length, weight, capacity, time, money
         if (gameId === 'measurement-mission') {
             const options = [currentQ.option1, currentQ.option2, currentQ.option3, currentQ.option4].filter(Boolean) as string[];
             const measureIcons: Record<string, string> = {
@@ -668,7 +668,8 @@ export const SheetBasedGame: React.FC<SheetBasedGameProps> = ({ onBack, difficul
                 weight: '⚖️',
                 capacity: '🫗',
                 time: '⏱️',
-                temperature: '🌡️'
+                temperature: '🌡️',
+                money: '💰'
             };
             const measureType = currentQ.operation || 'length';
             return (
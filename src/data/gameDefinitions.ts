@@ -432,7 +432,8 @@ export const DEFAULT_SETTINGS = {
     generatorGrade: 'Grade 3',
     generatorDifficulty: 'Easy',
     levelUpMode: false,
-    surpriseMode: false
+    surpriseMode: false,
+    childName: ''
 };
 
 export default {
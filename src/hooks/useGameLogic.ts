@@ -2,6 +2,7 @@ import { useState, useEffect, useCallback } from 'react';
 import { Difficulty, Settings, Question, Feedback } from '../types';
 import { useSheetData } from './useSheetData';
 import { GAME_CONSTANTS } from '../constants/gameConstants';
+import { childKey, getHistory, preferUnanswered, recordAnswer } from '../utils/questionHistory';
 
 export const useGameLogic = (
     gameId: string,
@@ -44,6 +45,15 @@ export const useGameLogic = (
     const [answers, setAnswers] = useState<Record<number, { selected: string, isCorrect: boolean }>>({});
     const [hintLogs, setHintLogs] = useState<Record<number, boolean>>({});
 
+    // Ids of questions already answered correctly; these go to the back of the queue
+    const [answeredIds, setAnsweredIds] = useState<Set<string>>(new Set());
+
+    const child = childKey(settings.childName);
+
+    useEffect(() => {
+        getHistory(child).then(history => setAnsweredIds(new Set(history.answered)));
+    }, [gameOver, child]);
+
     const filterQuestions = useCallback(() => {
         return allQuestions.filter(q => !q.difficulty || q.difficulty === difficulty || difficulty === 'None');
     }, [allQuestions, difficulty]);
@@ -108,7 +118,7 @@ export const useGameLogic = (
                 }
             }
         } else {
-            const shuffled = shuffleArray(filtered);
+            const shuffled = preferUnanswered(shuffleArray(filtered), answeredIds);
             // Check if game is an Exam type (currently just fraction-exam)
             const isExam = ['fraction-exam'].includes(gameId);
             const questionLimit = isExam ? 25 : 10;
@@ -133,6 +143,8 @@ export const useGameLogic = (
 
         const isCorrect = selected === correct || selected === String(correct);
 
+        if (currentQ) recordAnswer(currentQ, isCorrect, child);
+
         // Save answer
         setAnswers(prev => ({
             ...prev,
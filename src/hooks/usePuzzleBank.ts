@@ -0,0 +1,63 @@
+import { useState, useEffect } from 'react';
+import { parseCSV } from '../utils/csvParser';
+
+// Pre-solved grid puzzles written by scripts/generate_puzzles.py to public/puzzles/.
+// Cells are numbered row by row (index = y * size + x); cell sets are hex bitmasks.
+export type PuzzleRow = Record<string, string>;
+
+export const usePuzzleBank = (name: string) => {
+    const [puzzles, setPuzzles] = useState<PuzzleRow[]>([]);
+
+    useEffect(() => {
+        let isMounted = true;
+        fetch(`${import.meta.env.BASE_URL}puzzles/${name}.csv`)
+            .then(res => (res.ok ? res.text() : ''))
+            .then(csv => {
+                if (isMounted) setPuzzles(parseCSV(csv) as unknown as PuzzleRow[]);
+            })
+            .catch(() => {
+                // Games fall back to random layouts when the puzzle bank is unavailable
+            });
+        return () => { isMounted = false; };
+    }, [name]);
+
+    return puzzles;
+};
+
+export const maskCells = (hex: string): number[] => {
+    const mask = parseInt(hex || '0', 16);
+    const cells: number[] = [];
+    for (let cell = 0; cell < 31; cell++) {
+        if (mask & (1 << cell)) cells.push(cell);
+    }
+    return cells;
+};
+
+// Puzzles are stored in one canonical orientation; show them rotated or mirrored at random
+export const randomSymmetry = (size: number) => {
+    const last = size - 1;
+    const rotations = Math.floor(Math.random() * 4);
+    const mirror = Math.random() < 0.5;
+    return (cell: number): number => {
+        let x = cell % size;
+        let y = Math.floor(cell / size);
+        if (mirror) x = last - x;
+        for (let i = 0; i < rotations; i++) [x, y] = [last - y, x];
+        return y * size + x;
+    };
+};
+
+// A puzzle's difficulty is its third of the grid's pool, easiest first. The game's difficulty only
+// picks the grid; the third rises with the round, so one game works through the whole pool.
+const TIERS = ['Easy', 'Medium', 'Hard'];
+const ROUNDS_PER_TIER = 3;
+
+export const tierForRound = (round: number): string =>
+    TIERS[Math.min(TIERS.length - 1, Math.floor((Math.max(1, round) - 1) / ROUNDS_PER_TIER))];
+
+export const pickPuzzle = (puzzles: PuzzleRow[], match: (puzzle: PuzzleRow) => boolean, round = 1): PuzzleRow | null => {
+    const candidates = puzzles.filter(match);
+    const tier = candidates.filter(puzzle => puzzle.difficulty === tierForRound(round));
+    const pool = tier.length > 0 ? tier : candidates;
+    return pool.length > 0 ? pool[Math.floor(Math.random() * pool.length)] : null;
+};
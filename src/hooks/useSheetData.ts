@@ -20,8 +20,15 @@ export const useSheetData = (url: string, gameType: string) => {
             .then(res => res.text())
             .then(csv => {
                 if (!isMounted) return;
+                const parseStart = performance.now();
                 const parsed = parseCSV(csv);
                 const filtered = gameType ? parsed.filter(row => row.game_type === gameType) : parsed;
+                // User Timing entry read by verification/audit_network.py
+                try {
+                    performance.measure(`sheet-parse ${gameType} ${url}`, { start: parseStart, end: performance.now() });
+                } catch {
+                    // Older browsers only support mark names here
+                }
                 setData(filtered);
                 setLoading(false);
             })
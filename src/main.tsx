@@ -17,3 +17,12 @@ if (rootElement) {
         </React.StrictMode>
     );
 }
+
+// Offline support: precaches the app shell and question banks (see public/sw.js). Skipped in dev so edits show up immediately.
+if (import.meta.env.PROD && 'serviceWorker' in navigator) {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register(`${import.meta.env.BASE_URL}sw.js`)
+            .then(registration => registration.active?.postMessage('sync-data'))
+            .catch(err => console.error('Service worker registration failed:', err));
+    });
+}
@@ -66,6 +66,7 @@ export interface Settings {
     surpriseMode: boolean;
     useGoogleSheets?: boolean;
     levelUpMode?: boolean;
+    childName?: string; // Whose question history this device records (see utils/questionHistory)
 }
 
 export interface QAStats {
@@ -0,0 +1,40 @@
+import { fnv1a64, questionId, recordAnswer, exportHistory, preferUnanswered, childKey, listChildren } from './questionHistory';
+import { describe, it, expect, beforeEach } from 'vitest';
+import { Question } from '../types';
+
+const question: Question = { game_type: 'space-math', difficulty: 'Easy', num1: '3', num2: '4', operation: 'add', answer: '7' };
+
+describe('questionHistory', () => {
+    beforeEach(() => {
+        localStorage.clear();
+    });
+
+    it('hashes like scripts/data_pipeline.py', () => {
+        expect(fnv1a64('')).toBe('cbf29ce484222325');
+        expect(fnv1a64('a')).toBe('af63dc4c8601ec8c');
+        expect(questionId(question)).toBe('58d55978bc5cd6a4');
+    });
+
+    it('records seen and correctly answered ids', async () => {
+        await recordAnswer(question, false);
+        await recordAnswer(question, true);
+        const exported = await exportHistory();
+        expect(exported.seen).toEqual(['58d55978bc5cd6a4']);
+        expect(exported.answered).toEqual(['58d55978bc5cd6a4']);
+        expect(exported.child).toBe('default');
+    });
+
+    it('keeps a separate history per child', async () => {
+        await recordAnswer(question, true, childKey('  Asha '));
+        await recordAnswer(question, false, childKey(''));
+        expect(await listChildren()).toEqual(['Asha', 'default']);
+        expect((await exportHistory('Asha')).answered).toEqual(['58d55978bc5cd6a4']);
+        expect((await exportHistory()).answered).toEqual([]);
+    });
+
+    it('moves answered questions to the back', () => {
+        const other: Question = { ...question, num1: '5', answer: '9' };
+        const ordered = preferUnanswered([question, other], new Set([questionId(question)]));
+        expect(ordered).toEqual([other, question]);
+    });
+});
@@ -0,0 +1,94 @@
+// Per-child record of which questions have been shown and answered correctly.
+// Ids match row_id() in scripts/data_pipeline.py, so an exported history can be fed to
+// scripts/build_session_packs.py to build packs of questions the child has not done yet.
+
+import { Question } from '../types';
+import { storage } from './storage';
+
+const HISTORY_KEY = 'kani-question-history';
+export const DEFAULT_CHILD = 'default';
+
+// Settings.childName picks whose history is recorded; unnamed play goes to DEFAULT_CHILD
+export const childKey = (childName?: string): string => childName?.trim() || DEFAULT_CHILD;
+
+// Keep in sync with IDENTITY_FIELDS in scripts/data_pipeline.py
+const IDENTITY_FIELDS = ['game_type', 'difficulty', 'text1', 'text2', 'num1', 'num2', 'operation', 'story_id', 'question_num'] as const;
+
+export interface ChildHistory {
+    seen: string[];
+    answered: string[]; // Answered correctly at least once
+}
+
+export interface HistoryExport extends ChildHistory {
+    version: 1;
+    child: string;
+    exported_at: string;
+}
+
+type HistoryStore = Record<string, ChildHistory>;
+
+const FNV_OFFSET = 0xcbf29ce484222325n;
+const FNV_PRIME = 0x100000001b3n;
+const MASK_64 = 0xffffffffffffffffn;
+
+export const fnv1a64 = (text: string): string => {
+    let value = FNV_OFFSET;
+    for (const byte of new TextEncoder().encode(text)) {
+        value = ((value ^ BigInt(byte)) * FNV_PRIME) & MASK_64;
+    }
+    return value.toString(16).padStart(16, '0');
+};
+
+export const questionId = (question: Question): string =>
+    fnv1a64(IDENTITY_FIELDS.map(field => question[field] || '').join('\x1f'));
+
+const loadStore = async (): Promise<HistoryStore> => {
+    const raw = await storage.get(HISTORY_KEY);
+    if (!raw) return {};
+    try {
+        return JSON.parse(raw);
+    } catch {
+        return {};
+    }
+};
+
+export const getHistory = async (child: string = DEFAULT_CHILD): Promise<ChildHistory> => {
+    const store = await loadStore();
+    return store[child] || { seen: [], answered: [] };
+};
+
+export const recordAnswer = async (question: Question, isCorrect: boolean, child: string = DEFAULT_CHILD): Promise<void> => {
+    const store = await loadStore();
+    const history = store[child] || { seen: [], answered: [] };
+    const id = questionId(question);
+    if (!history.seen.includes(id)) history.seen.push(id);
+    if (isCorrect && !history.answered.includes(id)) history.answered.push(id);
+    store[child] = history;
+    await storage.set(HISTORY_KEY, JSON.stringify(store));
+};
+
+export const listChildren = async (): Promise<string[]> => Object.keys(await loadStore()).sort();
+
+export const exportHistory = async (child: string = DEFAULT_CHILD): Promise<HistoryExport> => {
+    const history = await getHistory(child);
+    return { version: 1, child, exported_at: new Date().toISOString(), ...history };
+};
+
+// Saves an export as JSON for scripts/build_session_packs.py --history
+export const downloadHistory = async (child: string = DEFAULT_CHILD): Promise<void> => {
+    const exported = await exportHistory(child);
+    const url = URL.createObjectURL(new Blob([JSON.stringify(exported, null, 2)], { type: 'application/json' }));
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = `kani-history-${child.replace(/[^A-Za-z0-9_-]/g, '_')}.json`;
+    link.click();
+    URL.revokeObjectURL(url);
+};
+
+// Stable partition: questions not yet answered correctly come first, keeping their order
+export const preferUnanswered = (questions: Question[], answered: Set<string>): Question[] => {
+    const fresh: Question[] = [];
+    const done: Question[] = [];
+    questions.forEach(q => (answered.has(questionId(q)) ? done : fresh).push(q));
+    return [...fresh, ...done];
+};
@@ -0,0 +1,249 @@
+import random
+from collections import deque
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+
+# Unit conversion questions for Measurement Mission, generated from a small unit graph.
+# Factors are exact Fractions and every path between two units is worked out once, so
+# answers like 10.05 m -> 1005 cm never pass through floats or string patching.
+
+# (bigger unit, smaller unit, how many smaller units make one bigger unit,
+#  factors children commonly use by mistake for this step)
+EDGES = {
+    'length': [
+        ('cm', 'mm', 10, [100]),
+        ('m', 'cm', 100, [10, 1000]),
+        ('km', 'm', 1000, [100, 10]),
+    ],
+    'weight': [
+        ('kg', 'g', 1000, [100, 10]),
+    ],
+    'time': [
+        ('minute', 'second', 60, [100, 10]),
+        ('hour', 'minute', 60, [100, 30]),
+        ('day', 'hour', 24, [12, 10]),
+        ('week', 'day', 7, [5, 10]),
+    ],
+    'capacity': [
+        ('l', 'ml', 1000, [100, 10]),
+    ],
+    'money': [
+        ('dollar', 'cent', 100, [10, 1000]),
+    ],
+}
+
+UNIT_NAMES = {
+    'mm': ('millimeter', 'millimeters'), 'cm': ('centimeter', 'centimeters'),
+    'm': ('meter', 'meters'), 'km': ('kilometer', 'kilometers'),
+    'g': ('gram', 'grams'), 'kg': ('kilogram', 'kilograms'),
+    'second': ('second', 'seconds'), 'minute': ('minute', 'minutes'), 'hour': ('hour', 'hours'),
+    'day': ('day', 'days'), 'week': ('week', 'weeks'),
+    'ml': ('milliliter', 'milliliters'), 'l': ('liter', 'liters'),
+    'cent': ('cent', 'cents'), 'dollar': ('dollar', 'dollars'),
+}
+
+# Amounts of the bigger unit that questions are built from
+QUANTITIES = (
+    [Fraction(n) for n in range(1, 13)]
+    + [Fraction(n, 2) for n in range(1, 20, 2)]
+    + [Fraction(n, 4) for n in (1, 3, 5, 7, 9, 11)]
+    + [Fraction(text) for text in ('1.05', '2.05', '3.15', '4.35', '5.65', '10.05', '12.08')]
+)
+
+MAX_STEPS = 2
+MAX_VALUE = 100000
+MAX_DECIMALS = 2
+
+
+@lru_cache(maxsize=None)
+def conversion_paths():
+    """(from, to) -> (dimension, exact factor, [edge, ...]) for every connected pair of units."""
+    paths = {}
+    for dimension, edges in EDGES.items():
+        neighbours = {}
+        for edge in edges:
+            bigger, smaller = edge[0], edge[1]
+            neighbours.setdefault(bigger, []).append((smaller, edge))
+            neighbours.setdefault(smaller, []).append((bigger, edge))
+
+        for start in neighbours:
+            # BFS gives the fewest steps, which is also the chain a child would use
+            queue = deque([(start, [])])
+            visited = {start}
+            while queue:
+                unit, steps = queue.popleft()
+                if steps:
+                    paths[(start, unit)] = (dimension, path_factor(start, steps), steps)
+                for neighbour, edge in neighbours[unit]:
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        queue.append((neighbour, steps + [edge]))
+    return paths
+
+
+def path_factor(start, steps, factors=None):
+    """Multiply going to smaller units, divide going to bigger ones."""
+    factor = Fraction(1)
+    unit = start
+    for i, (bigger, smaller, step_factor, _) in enumerate(steps):
+        step_factor = factors[i] if factors else step_factor
+        if unit == bigger:
+            factor *= step_factor
+            unit = smaller
+        else:
+            factor /= step_factor
+            unit = bigger
+    return factor
+
+
+def is_nice(value, unit):
+    """Positive, not too big and written with at most MAX_DECIMALS decimal places (whole cents)."""
+    if unit == 'cent' and value.denominator != 1:
+        return False
+    return 0 < value <= MAX_VALUE and (10 ** MAX_DECIMALS) % value.denominator == 0
+
+
+def format_number(value):
+    if value.denominator == 1:
+        return str(value.numerator)
+    text = format(Decimal(value.numerator) / Decimal(value.denominator), 'f')
+    return text.rstrip('0').rstrip('.')
+
+
+def format_quantity(value, unit):
+    if unit == 'dollar':
+        return f"${Decimal(value.numerator) / Decimal(value.denominator):.2f}"
+    if unit == 'cent':
+        return f"{format_number(value)}¢"
+    return format_number(value)
+
+
+def describe(value, unit):
+    if unit in ('dollar', 'cent'):
+        return format_quantity(value, unit)
+    singular, plural = UNIT_NAMES[unit]
+    return f"{format_number(value)} {singular if value == 1 else plural}"
+
+
+def difficulty_of(steps, to_bigger, value, answer):
+    # Dividing, decimals and extra steps each make a conversion harder
+    score = len(steps) - 1 + to_bigger
+    for number in (value, answer):
+        if number.denominator != 1:
+            score += 1 if 10 % number.denominator == 0 else 2
+    return 'Easy' if score == 0 else 'Medium' if score <= 2 else 'Hard'
+
+
+@lru_cache(maxsize=None)
+def conversion_pool():
+    """Every valid conversion question, enumerated once."""
+    pool = []
+    for (start, end), (dimension, factor, steps) in sorted(conversion_paths().items()):
+        if len(steps) > MAX_STEPS or factor < 1:
+            continue
+        # Build from the bigger unit so both directions share one set of quantities
+        for quantity in QUANTITIES:
+            small = quantity * factor
+            if small.denominator != 1 or small > MAX_VALUE:
+                continue
+            for from_unit, to_unit, value, answer in ((start, end, quantity, small), (end, start, small, quantity)):
+                to_bigger = from_unit == end
+                pool.append({
+                    'dimension': dimension,
+                    'from_unit': from_unit,
+                    'to_unit': to_unit,
+                    'value': value,
+                    'answer': answer,
+                    'steps': steps if not to_bigger else list(reversed(steps)),
+                    'difficulty': difficulty_of(steps, to_bigger, value, answer),
+                })
+    return pool
+
+
+def mistaken_answers(item):
+    """Answers produced by common conversion mistakes, most plausible first."""
+    value, answer, steps = item['value'], item['answer'], item['steps']
+    start = item['from_unit']
+    factors = [step[2] for step in steps]
+
+    # Multiplied instead of divided (or the other way round)
+    yield value / path_factor(start, steps)
+
+    # Used the wrong factor for one step, e.g. 10 cm in a meter or 100 minutes in an hour
+    for i, step in enumerate(steps):
+        for wrong in step[3]:
+            yield value * path_factor(start, steps, factors[:i] + [wrong] + factors[i + 1:])
+
+    # Stopped after the first step of a two step conversion
+    if len(steps) > 1:
+        yield value * path_factor(start, steps[:1])
+
+    # Dropped the zero after the decimal point: 10.05 written as 10.5
+    text = format_number(answer)
+    if '.0' in text:
+        yield Fraction(text.replace('.0', '.', 1))
+
+    # Read hours and minutes as a decimal: 90 minutes as 1.30 hours
+    if item['dimension'] == 'time' and item['to_unit'] == 'hour' and answer.denominator != 1:
+        whole = answer.numerator // answer.denominator
+        yield whole + Fraction(int((answer - whole) * 60), 100)
+
+
+def pick_distractors(item, count=3):
+    answer = item['answer']
+    chosen = []
+    fallbacks = (answer * 2, answer / 2, answer * 10, answer / 10, answer + 1, answer - 1)
+    for candidate in list(mistaken_answers(item)) + list(fallbacks):
+        # Compare as written, since two values that print the same would be two identical buttons
+        if is_nice(candidate, item['to_unit']) and candidate != answer and candidate not in chosen \
+                and format_quantity(candidate, item['to_unit']) != format_quantity(answer, item['to_unit']):
+            chosen.append(candidate)
+        if len(chosen) == count:
+            break
+    return chosen
+
+
+def step_fact(bigger, smaller, factor):
+    return f"1 {UNIT_NAMES[bigger][0]} = {describe(Fraction(factor), smaller)}"
+
+
+def question_fields(item, rng=random):
+    from_unit, to_unit = item['from_unit'], item['to_unit']
+    to_name = UNIT_NAMES[to_unit][1]
+    if item['dimension'] == 'money':
+        text = f"How much is {format_quantity(item['value'], from_unit)} in {to_name}?"
+    else:
+        text = f"How many {to_name} are in {describe(item['value'], from_unit)}?"
+
+    options = [item['answer']] + pick_distractors(item)
+    rng.shuffle(options)
+    factor = path_factor(from_unit, item['steps'])
+    sign = '×' if factor >= 1 else '÷'
+    shown = factor if factor >= 1 else 1 / factor
+    return {
+        'text1': text,
+        'answer': format_quantity(item['answer'], to_unit),
+        'options': [format_quantity(option, to_unit) for option in options],
+        'hint': ', '.join(step_fact(bigger, smaller, factor) for bigger, smaller, factor, _ in item['steps']),
+        'know_more': f"{describe(item['value'], from_unit)} {sign} {format_number(shown)} = {describe(item['answer'], to_unit)}",
+        'difficulty': item['difficulty'],
+        'operation': item['dimension'],
+    }
+
+
+def sample_conversions(count, rng=random, difficulty=None):
+    """Up to count distinct conversions, spread evenly over the dimensions."""
+    by_dimension = {}
+    for item in conversion_pool():
+        if difficulty is None or item['difficulty'] == difficulty:
+            by_dimension.setdefault(item['dimension'], []).append(item)
+    for items in by_dimension.values():
+        rng.shuffle(items)
+
+    picked = []
+    while len(picked) < count and any(by_dimension.values()):
+        for items in by_dimension.values():
+            if items and len(picked) < count:
+                picked.append(items.pop())
+    return picked
@@ -0,0 +1,186 @@
+import argparse
+import json
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from playwright.sync_api import sync_playwright
+
+from game_catalog import BASE_URL, load_games, open_game
+
+# Walks every game with the dev server running (npm run dev) and records each request made
+# while the game loads: URL, bytes, timing and whether it came from the network or a cache.
+# The app is loaded once and each game is opened in the app (back to the landing page, then
+# its tile), so repeat fetches of the same sheet between games show up as duplicates.
+# CSV parse time comes from the "sheet-parse" User Timing entries written by useSheetData.
+
+DATA_SUFFIXES = ('.csv', '.json')
+STARTUP = '(startup)'  # requests made by the first page load
+
+
+class NetworkRecorder:
+    def __init__(self, cdp):
+        self.requests = {}
+        self.game = None
+        cdp.on('Network.requestWillBeSent', self.on_request)
+        cdp.on('Network.requestServedFromCache', self.on_served_from_cache)
+        cdp.on('Network.responseReceived', self.on_response)
+        cdp.on('Network.dataReceived', self.on_data)
+        cdp.on('Network.loadingFinished', self.on_finished)
+        cdp.send('Network.enable')
+
+    def on_request(self, event):
+        self.requests[event['requestId']] = {
+            'game': self.game,
+            'url': event['request']['url'],
+            'method': event['request']['method'],
+            'type': event.get('type', ''),
+            'start': event['timestamp'],
+            'status': None,
+            'cache': 'network',
+            'transfer_bytes': 0,
+            'body_bytes': 0,
+            'duration_ms': None,
+        }
+
+    def on_served_from_cache(self, event):
+        if event['requestId'] in self.requests:
+            self.requests[event['requestId']]['cache'] = 'memory'
+
+    def on_response(self, event):
+        request = self.requests.get(event['requestId'])
+        if not request:
+            return
+        response = event['response']
+        request['status'] = response.get('status')
+        if response.get('fromServiceWorker'):
+            request['cache'] = 'service-worker'
+        elif response.get('fromDiskCache'):
+            request['cache'] = 'disk'
+        elif response.get('status') == 304:
+            request['cache'] = 'revalidated'
+
+    def on_data(self, event):
+        request = self.requests.get(event['requestId'])
+        if request:
+            request['body_bytes'] += event.get('dataLength', 0)
+
+    def on_finished(self, event):
+        request = self.requests.get(event['requestId'])
+        if request:
+            request['transfer_bytes'] = int(event.get('encodedDataLength', 0))
+            request['duration_ms'] = round((event['timestamp'] - request['start']) * 1000, 1)
+
+    def for_game(self, game_id):
+        return [request for request in self.requests.values() if request['game'] == game_id]
+
+
+def is_data(url):
+    return urlsplit(url).path.endswith(DATA_SUFFIXES) or 'output=csv' in url
+
+
+def parse_timings(page):
+    entries = page.evaluate(
+        "performance.getEntriesByType('measure')"
+        ".filter(e => e.name.startsWith('sheet-parse '))"
+        ".map(e => ({ name: e.name, duration: e.duration }))")
+    return [{'url': entry['name'].split(' ', 2)[2], 'parse_ms': round(entry['duration'], 2)} for entry in entries]
+
+
+def summarize(games, recorder, parse_by_game):
+    fetched_by = defaultdict(list)
+    report_games = []
+    for game in [{'id': STARTUP}] + games:
+        requests = recorder.for_game(game['id'])
+        data = [request for request in requests if is_data(request['url'])]
+        for request in data:
+            fetched_by[request['url']].append(game['id'])
+        report_games.append({
+            'id': game['id'],
+            'requests': len(requests),
+            'transfer_bytes': sum(request['transfer_bytes'] for request in requests),
+            'data_requests': len(data),
+            'data_transfer_bytes': sum(request['transfer_bytes'] for request in data),
+            'data_body_bytes': sum(request['body_bytes'] for request in data),
+            'data_from_network': sum(1 for request in data if request['cache'] in ('network', 'revalidated')),
+            'parse': parse_by_game.get(game['id'], []),
+            'parse_ms': round(sum(entry['parse_ms'] for entry in parse_by_game.get(game['id'], [])), 2),
+        })
+
+    duplicates = [
+        {'url': url, 'fetches': len(game_ids), 'games': sorted(set(game_ids))}
+        for url, game_ids in sorted(fetched_by.items()) if len(game_ids) > 1
+    ]
+    return {
+        'games': report_games,
+        'duplicates': duplicates,
+        'requests': list(recorder.requests.values()),
+    }
+
+
+def print_summary(report):
+    print(f"\n{'game':<26}{'reqs':>6}{'data':>6}{'net':>5}{'KB':>10}{'parse ms':>10}")
+    for game in report['games']:
+        print(f"{game['id']:<26}{game['requests']:>6}{game['data_requests']:>6}{game['data_from_network']:>5}"
+              f"{game['data_transfer_bytes'] / 1024:>10.1f}{game['parse_ms']:>10.2f}")
+
+    if report['duplicates']:
+        print("\nData files fetched more than once:")
+        for duplicate in report['duplicates']:
+            print(f"  {duplicate['fetches']}x {duplicate['url']} ({', '.join(duplicate['games'])})")
+
+
+def audit_network(base_url, only, output, fresh):
+    games = load_games(only)
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context(viewport={'width': 1280, 'height': 800})
+        page = context.new_page()
+        cdp = context.new_cdp_session(page)
+        recorder = NetworkRecorder(cdp)
+        if fresh:
+            # Model a device with nothing cached between games
+            cdp.send('Network.setCacheDisabled', {'cacheDisabled': True})
+
+        recorder.game = STARTUP
+        page.goto(base_url)
+        page.wait_for_load_state("networkidle")
+
+        parse_by_game = {}
+        parsed = 0
+        for game in games:
+            print(f"Auditing {game['title']}...")
+            # Covers leaving the previous game too, since a refetch can start as soon as the URL changes
+            recorder.game = game['id']
+            try:
+                open_game(page, game, base_url, reload=False)
+                page.wait_for_load_state("networkidle")
+                timings = parse_timings(page)
+                # The page is never reloaded, so the measures accumulate; keep only this game's
+                parse_by_game[game['id']] = timings[parsed:]
+                parsed = len(timings)
+            except Exception as e:
+                print(f"  Failed {game['title']}: {e}")
+                # Start the next game from a clean page rather than from wherever this one stopped
+                recorder.game = STARTUP
+                page.goto(base_url)
+                page.wait_for_load_state("networkidle")
+                parsed = 0
+            recorder.game = None
+
+        browser.close()
+
+    report = summarize(games, recorder, parse_by_game)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print_summary(report)
+    print(f"\nFull report written to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record network requests and CSV parse time per game.")
+    parser.add_argument('--base-url', default=BASE_URL)
+    parser.add_argument('--games', help="Comma separated game ids (default: all)")
+    parser.add_argument('--output', default='verification/network_audit.json')
+    parser.add_argument('--no-cache', action='store_true', help="Disable the HTTP cache for the whole walk")
+    args = parser.parse_args()
+    audit_network(args.base_url, args.games.split(',') if args.games else None, args.output, args.no_cache)
@@ -0,0 +1,81 @@
+import os
+import re
+
+# Game list and navigation helpers shared by the verification scripts.
+# Games are read from src/data/gameDefinitions.ts so new games are picked up automatically.
+
+BASE_URL = "http://localhost:3000/Kani-Game-App/"
+DEFINITIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'data', 'gameDefinitions.ts')
+
+# Landing page buttons to click to reach each group's game tiles
+MENU_PATH = {
+    'MATH': ['Math'],
+    'GRAMMAR': ['English', 'Grammar'],
+    'VOCABULARY': ['English', 'Vocabulary'],
+    'COMPREHENSION': ['English', 'Comprehension'],
+    'SKILL': ['Brain Training'],
+    'EXAM': ['Exam'],
+}
+
+GROUP_RE = re.compile(r'export const (\w+)_GAMES: GameDefinition\[\] = \[(.*?)\n\];', re.S)
+GAME_RE = re.compile(r"id: '([^']+)',\s*title: '([^']+)'")
+
+
+def load_games(only=None):
+    with open(DEFINITIONS, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    games = []
+    for group, body in GROUP_RE.findall(source):
+        if group not in MENU_PATH:
+            continue
+        for game_id, title in GAME_RE.findall(body):
+            if not only or game_id in only:
+                games.append({'id': game_id, 'title': title, 'group': group})
+    return games
+
+
+def return_home(page, timeout=5000):
+    """Go back to the landing page in the app, without reloading it."""
+    home = page.locator(f'h2:text-is("{MENU_PATH["MATH"][0]}")')
+    # Games go straight home; menus and the difficulty screen go up one level
+    for _ in range(4):
+        if home.is_visible():
+            return
+        page.locator('button:text-is("←")').first.click(timeout=timeout)
+    home.wait_for(timeout=timeout)
+
+
+def open_game(page, game, base_url=BASE_URL, start=True, timeout=5000, reload=True):
+    """Navigate from the landing page to a game; returns True once it is ready (or started).
+
+    With reload=False the app already open in the page is reused: it goes back to the landing
+    page and opens the game from there, as a child switching games would.
+    """
+    if reload:
+        page.goto(base_url)
+        page.wait_for_load_state("networkidle")
+    else:
+        return_home(page, timeout)
+
+    for label in MENU_PATH[game['group']]:
+        page.click(f'h2:text-is("{label}")', timeout=timeout)
+
+    page.click(f'text="{game["title"]}"', timeout=timeout)
+
+    # Difficulty selection (if present)
+    easy = page.locator('button:has-text("Easy")').first
+    if easy.is_visible():
+        easy.click()
+
+    start_button = page.locator('button:has-text("START GAME")')
+    no_questions = page.locator(':text("No Questions Available")')
+    start_button.or_(no_questions).first.wait_for(timeout=timeout * 2)
+    if no_questions.first.is_visible():
+        print(f"  {game['title']}: no questions available")
+        return False
+
+    if start:
+        start_button.first.click(timeout=timeout)
+        page.wait_for_timeout(1000)  # Wait for animation/render
+    return True
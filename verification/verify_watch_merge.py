@@ -0,0 +1,70 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+from data_pipeline import ROOT_BANKS, assign_row_ids, read_csv  # noqa: E402
+from watch_data import merge_root_changes, rows_by_id  # noqa: E402
+
+# Checks how scripts/watch_data.py carries root bank edits into the public banks.
+# Read only: merge_root_changes returns the new public text, nothing is written.
+#
+#   python verification/verify_watch_merge.py
+
+
+def changed_lines(before, after):
+    old, new = before.splitlines(), after.splitlines()
+    return len(old), len(new), sum(1 for a, b in zip(old, new) if a != b)
+
+
+def verify_bank(root_path):
+    public_path = ROOT_BANKS[root_path]
+    root_fields, root_rows = read_csv(root_path)
+    old_root = rows_by_id(root_rows)
+    public_ids = set(assign_row_ids(read_csv(public_path)[1]))
+    with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), public_path),
+              'r', encoding='utf-8', newline='') as f:
+        public_text = f.read()
+
+    matched = next((rid for rid in old_root if rid in public_ids and old_root[rid].get('know_more') is not None), None)
+    unmatched = next((rid for rid in old_root if rid not in public_ids and old_root[rid].get('know_more') is not None), None)
+    failures = []
+
+    if matched:
+        # One edited cell in a row the public bank has: one line changes, nothing is added
+        new_root = {**old_root, matched: {**old_root[matched], 'know_more': old_root[matched]['know_more'] + ' '}}
+        text, summary, skipped = merge_root_changes(public_path, old_root, new_root, root_fields)
+        before, after, changed = changed_lines(public_text, text or public_text)
+        if (summary['updated'], summary['added'], before, changed, skipped) != (1, 0, after, 1, []):
+            failures.append(f"edited matched row: {summary}, {changed} line(s) changed, {before} -> {after} lines")
+
+    if unmatched:
+        # An edited row with no public copy is reported, never added as a new question
+        new_root = {**old_root, unmatched: {**old_root[unmatched], 'know_more': old_root[unmatched]['know_more'] + ' '}}
+        text, summary, skipped = merge_root_changes(public_path, old_root, new_root, root_fields)
+        if text is not None or summary['added'] or len(skipped) != 1:
+            failures.append(f"edited unmatched row: {summary}, {'rewrote' if text else 'left'} the public bank")
+
+    # A brand new question is added once
+    fresh = {**root_rows[0], 'text1': (root_rows[0].get('text1') or '') + ' (verify_watch_merge)'}
+    new_root = {**old_root, 'new': fresh}
+    text, summary, _ = merge_root_changes(public_path, old_root, new_root, root_fields)
+    before, after, _ = changed_lines(public_text, text or public_text)
+    if summary['added'] != 1 or after != before + 1:
+        failures.append(f"new row: {summary}, {before} -> {after} lines")
+
+    status = 'FAIL' if failures else 'ok'
+    print(f"{status:<4} {root_path}: {len(old_root)} root rows, "
+          f"{sum(1 for rid in old_root if rid not in public_ids)} without a public copy")
+    for failure in failures:
+        print(f"       {failure}")
+    return not failures
+
+
+def main():
+    results = [verify_bank(root_path) for root_path in ROOT_BANKS]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageChops
+
+from game_catalog import BASE_URL, load_games, open_game
+
+# Screenshot every game at several viewports and compare against verification/baseline/.
+# Images are compared by perceptual hashes of a grid of tiles first, so a change in one corner
+# still flips bits; only hash mismatches get a pixel diff. A game with no screenshot or no
+# baseline fails the run.
+# Needs the dev server (npm run dev), Playwright and Pillow.
+#
+#   python verification/visual_regression.py --update-baseline   # record baselines
+#   python verification/visual_regression.py                     # capture and compare
+
+VERIFICATION_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DIR = os.path.join(VERIFICATION_DIR, 'baseline')
+CAPTURE_DIR = os.path.join(VERIFICATION_DIR, 'screenshots')
+DIFF_DIR = os.path.join(VERIFICATION_DIR, 'diffs')
+HASH_CACHE = os.path.join(BASELINE_DIR, 'hashes.json')
+
+VIEWPORTS = {
+    'desktop': {'width': 1280, 'height': 800},
+    'tablet': {'width': 1024, 'height': 768},
+    'phone': {'width': 390, 'height': 844},
+}
+
+TILES = 8                  # hash a TILES x TILES grid of tiles, 64 bits each
+HASH_THRESHOLD = 0         # differing hash bits allowed before running the pixel diff
+PIXEL_TOLERANCE = 16       # per-channel difference ignored as anti-aliasing noise
+MAX_CHANGED_RATIO = 0.002  # share of pixels allowed to change before failing
+
+# Questions are shuffled with Math.random; seed it so every capture shows the same question
+SEEDED_RANDOM = """
+(() => {
+    let seed = 42;
+    Math.random = () => {
+        seed = (seed + 0x6D2B79F5) | 0;
+        let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+        t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+})();
+"""
+
+
+def tile_hash(path, tiles=TILES, size=8):
+    """Difference hash of each tile, concatenated row by row."""
+    bits = 0
+    with Image.open(path) as image:
+        gray = image.convert('L')
+        width, height = gray.size
+        for tile_y in range(tiles):
+            for tile_x in range(tiles):
+                box = (tile_x * width // tiles, tile_y * height // tiles,
+                       (tile_x + 1) * width // tiles, (tile_y + 1) * height // tiles)
+                pixels = list(gray.crop(box).resize((size + 1, size), Image.LANCZOS).getdata())
+                for row in range(size):
+                    for col in range(size):
+                        left = pixels[row * (size + 1) + col]
+                        right = pixels[row * (size + 1) + col + 1]
+                        bits = (bits << 1) | (left > right)
+    return f"{bits:0{tiles * tiles * size * size // 4}x}"
+
+
+def hamming(a, b):
+    return bin(int(a, 16) ^ int(b, 16)).count('1')
+
+
+def pixel_diff(baseline_path, capture_path, diff_path):
+    with Image.open(baseline_path) as baseline, Image.open(capture_path) as capture:
+        if baseline.size != capture.size:
+            return 1.0
+        diff = ImageChops.difference(baseline.convert('RGB'), capture.convert('RGB'))
+    mask = diff.convert('L').point(lambda value: 255 if value > PIXEL_TOLERANCE else 0)
+    changed = mask.histogram()[255]
+    ratio = changed / (mask.width * mask.height)
+    if ratio > MAX_CHANGED_RATIO:
+        os.makedirs(os.path.dirname(diff_path), exist_ok=True)
+        mask.save(diff_path)
+    return ratio
+
+
+def compare_one(job):
+    key, baseline_path, capture_path, baseline_hash = job
+    if not os.path.exists(capture_path):
+        return {'key': key, 'status': 'missing'}
+    if not os.path.exists(baseline_path):
+        return {'key': key, 'status': 'new'}
+
+    capture_hash = tile_hash(capture_path)
+    if not baseline_hash or len(baseline_hash) != len(capture_hash):
+        # Cached by an older hash layout
+        baseline_hash = tile_hash(baseline_path)
+    distance = hamming(baseline_hash, capture_hash)
+    if distance <= HASH_THRESHOLD:
+        return {'key': key, 'status': 'match', 'hash_distance': distance}
+
+    ratio = pixel_diff(baseline_path, capture_path, os.path.join(DIFF_DIR, key))
+    status = 'changed' if ratio > MAX_CHANGED_RATIO else 'match'
+    return {'key': key, 'status': status, 'hash_distance': distance, 'changed_ratio': round(ratio, 5)}
+
+
+def capture_viewport(job):
+    viewport_name, games, base_url = job
+    from playwright.sync_api import sync_playwright
+
+    captured = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context(viewport=VIEWPORTS[viewport_name], reduced_motion='reduce')
+        context.add_init_script(SEEDED_RANDOM)
+        page = context.new_page()
+        for game in games:
+            path = os.path.join(CAPTURE_DIR, viewport_name, f"{game['id']}.png")
+            try:
+                if open_game(page, game, base_url):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    page.screenshot(path=path, animations='disabled')
+                    captured.append(path)
+            except Exception as e:
+                print(f"  Failed {game['title']} ({viewport_name}): {e}")
+        browser.close()
+    return captured
+
+
+def load_hash_cache():
+    try:
+        with open(HASH_CACHE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def update_baseline(keys):
+    hashes = load_hash_cache()
+    for key in keys:
+        target = os.path.join(BASELINE_DIR, key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(os.path.join(CAPTURE_DIR, key), target)
+        hashes[key] = tile_hash(target)
+    with open(HASH_CACHE, 'w', encoding='utf-8') as f:
+        json.dump(hashes, f, indent=2, sort_keys=True)
+    print(f"Updated {len(keys)} baseline image(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Visual regression check for every game.")
+    parser.add_argument('--base-url', default=BASE_URL)
+    parser.add_argument('--games', help="Comma separated game ids (default: all)")
+    parser.add_argument('--viewports', default=','.join(VIEWPORTS), help="Comma separated viewport names")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--compare-only', action='store_true', help="Reuse the screenshots from the last capture")
+    parser.add_argument('--update-baseline', action='store_true', help="Accept the captured screenshots as the new baseline")
+    args = parser.parse_args()
+
+    games = load_games(args.games.split(',') if args.games else None)
+    viewports = args.viewports.split(',')
+    keys = [os.path.join(viewport, f"{game['id']}.png") for viewport in viewports for game in games]
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        if not args.compare_only:
+            # Start from empty folders so a game that fails to open cannot pass on an old screenshot
+            for viewport in viewports:
+                shutil.rmtree(os.path.join(CAPTURE_DIR, viewport), ignore_errors=True)
+                shutil.rmtree(os.path.join(DIFF_DIR, viewport), ignore_errors=True)
+            # Each worker runs its own browser over a slice of the games for one viewport
+            print(f"Capturing {len(games)} game(s) at {', '.join(viewports)}...")
+            slices = max(1, args.workers // len(viewports))
+            jobs = [(viewport, games[i::slices], args.base_url) for viewport in viewports for i in range(slices)]
+            captured = sum(len(paths) for paths in pool.map(capture_viewport, jobs))
+            if not captured:
+                print(f"No screenshots captured; is the dev server running at {args.base_url}?")
+                sys.exit(1)
+
+        if args.update_baseline:
+            update_baseline([key for key in keys if os.path.exists(os.path.join(CAPTURE_DIR, key))])
+            return
+
+        hashes = load_hash_cache()
+        jobs = [(key, os.path.join(BASELINE_DIR, key), os.path.join(CAPTURE_DIR, key), hashes.get(key)) for key in keys]
+        results = list(pool.map(compare_one, jobs, chunksize=4))
+
+    failed = [result for result in results if result['status'] != 'match']
+    for result in failed:
+        print(f"  {result['status'].upper():<8} {result['key']} {result.get('changed_ratio', '')}")
+    print(f"{len(results) - len(failed)}/{len(results)} screenshots match the baseline")
+    if any(result['status'] == 'changed' for result in failed):
+        print(f"Diff masks written to {DIFF_DIR}")
+    if any(result['status'] == 'new' for result in failed):
+        print("NEW screenshots have no baseline yet; review them and run with --update-baseline")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()